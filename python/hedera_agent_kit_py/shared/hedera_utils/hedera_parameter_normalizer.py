@@ -1,4 +1,6 @@
+from collections import Counter
 from decimal import Decimal
+from operator import attrgetter
 from typing import Optional, Union, cast, Any, Type
 
 from hiero_sdk_python import AccountId, PublicKey, Timestamp, Client, Hbar
@@ -24,12 +26,17 @@ from hedera_agent_kit_py.shared.parameter_schemas import (
     CreateTopicParametersNormalised,
     AccountBalanceQueryParameters,
     AccountBalanceQueryParametersNormalised,
+    GetTopicInfoParameters,
+    ExchangeRateQueryParameters,
 )
 from hedera_agent_kit_py.shared.parameter_schemas.account_schema import (
     AccountQueryParametersNormalised,
 )
 from hedera_agent_kit_py.shared.utils.account_resolver import AccountResolver
 
+# Fetches (amount, account_id) from a transfer entry in a single C-level call
+_TRANSFER_FIELDS = attrgetter("amount", "account_id")
+
 
 class HederaParameterNormaliser:
     """Utility class to normalise and validate Hedera transaction parameters.
@@ -48,6 +55,9 @@ class HederaParameterNormaliser:
     ) -> BaseModel:
         """Validate and parse parameters using a Pydantic schema.
 
+        Instances that are already exactly of the target schema type are returned
+        unchanged, so chained normalisers do not re-validate their own output.
+
         Args:
             params: The raw input parameters to validate.
             schema: The Pydantic model to validate against.
@@ -58,6 +68,11 @@ class HederaParameterNormaliser:
         Raises:
             ValueError: If validation fails, with a formatted description of the issues.
         """
+        if type(params) is schema:
+            return params
+
+        # model_validate runs the validator pydantic compiles once per model class,
+        # so no per-call schema construction happens here and no adapter cache is needed.
         try:
             return schema.model_validate(params)
         except ValidationError as e:
@@ -74,8 +89,10 @@ class HederaParameterNormaliser:
         Returns:
             str: Formatted error message summarising all field errors.
         """
+        # Model-level validators report errors without a field location
         return "; ".join(
-            f'Field "{err["loc"][0]}" - {err["msg"]}' for err in error.errors()
+            f'Field "{err["loc"][0]}" - {err["msg"]}' if err["loc"] else err["msg"]
+            for err in error.errors()
         )
 
     @staticmethod
@@ -113,20 +130,24 @@ class HederaParameterNormaliser:
             parsed_params.source_account_id, context, client
         )
 
-        # Convert transfers to dict[AccountId, int]
-        hbar_transfers: dict["AccountId", int] = {}
+        # Aggregate transfers per account (repeated recipients are summed)
+        aggregated: Counter["AccountId"] = Counter()
         total_tinybars: int = 0
 
-        for transfer in parsed_params.transfers:
-            tinybars = to_tinybars(Decimal(transfer.amount))
+        for amount, account_id in map(_TRANSFER_FIELDS, parsed_params.transfers):
+            tinybars = to_tinybars(Decimal(amount))
             if tinybars <= 0:
-                raise ValueError(f"Invalid transfer amount: {transfer.amount}")
+                raise ValueError(f"Invalid transfer amount: {amount}")
 
-            hbar_transfers[AccountId.from_string(transfer.account_id)] = tinybars
+            aggregated[AccountId.from_string(account_id)] += tinybars
             total_tinybars += tinybars
 
         # Subtract total from the source account
-        hbar_transfers[AccountId.from_string(source_account_id)] = -total_tinybars
+        aggregated.subtract({AccountId.from_string(source_account_id): total_tinybars})
+        # Drop accounts whose credits and debits cancel out (e.g. source paying itself)
+        hbar_transfers: dict["AccountId", int] = {
+            account: amount for account, amount in aggregated.items() if amount != 0
+        }
 
         # Handle optional scheduling
         scheduling_params = None
@@ -518,7 +539,7 @@ class HederaParameterNormaliser:
 
     @staticmethod
     def normalise_get_topic_info(
-            params: GetTopicInfoParameters,
+        params: GetTopicInfoParameters,
     ):
         """
         Normalizes the input parameters for the 'get_topic_info' operation to ensure
@@ -543,7 +564,7 @@ class HederaParameterNormaliser:
 
     @staticmethod
     def normalise_get_exchange_rate(
-            params: ExchangeRateQueryParameters,
+        params: ExchangeRateQueryParameters,
     ) -> ExchangeRateQueryParameters:
         """
         Normalises and parses the given exchange rate query parameters using a predefined
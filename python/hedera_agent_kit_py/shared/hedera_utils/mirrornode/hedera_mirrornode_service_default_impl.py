@@ -1,6 +1,7 @@
 import asyncio
+import time
 from decimal import Decimal
-from typing import Optional, Any, Dict, List, Coroutine
+from typing import Optional, Any, Dict, List, Tuple
 
 import aiohttp
 
@@ -29,27 +30,55 @@ from .types import (
 )
 
 
+# Symbols rarely change (only through a token update), so they are reused for a
+# while rather than fetched again for every balance listing
+TOKEN_SYMBOL_CACHE_TTL_SECONDS: float = 300.0
+TOKEN_SYMBOL_CACHE_MAX_SIZE: int = 1024
+
+
 class HederaMirrornodeServiceDefaultImpl(IHederaMirrornodeService):
-    def __init__(self, ledger_id: LedgerId):
+    def __init__(
+        self, ledger_id: LedgerId, session: Optional[aiohttp.ClientSession] = None
+    ):
+        """Create a mirror node service for the given ledger.
+
+        Args:
+            ledger_id (LedgerId): Ledger whose mirror node REST API is queried.
+            session (Optional[aiohttp.ClientSession]): Shared HTTP session reused
+                for every request, keeping connections alive between calls. Its
+                owner is responsible for closing it. When omitted, a short-lived
+                session is opened per request.
+        """
         if str(ledger_id.value) not in LedgerIdToBaseUrl:
             raise ValueError(f"Network type {ledger_id} not supported")
         self.base_url = LedgerIdToBaseUrl[ledger_id.value]
+        self.session = session
+        # token_id -> (fetched_at, symbol), oldest entries first
+        self._token_symbols: Dict[str, Tuple[float, str]] = {}
 
     async def _fetch_json(self, url: str, context: Optional[str] = None) -> Any:
         """Fetch JSON with context-aware error messages."""
+        if self.session is not None:
+            return await self._fetch_json_with_session(self.session, url, context)
         async with aiohttp.ClientSession() as session:
-            async with session.get(url) as resp:
-                text = await resp.text()
-                if resp.status != 200:
-                    raise RuntimeError(
-                        f"Failed to fetch {context or 'data'}: HTTP {resp.status} - {text}"
-                    )
-                try:
-                    return await resp.json()
-                except Exception as e:
-                    raise RuntimeError(
-                        f"Failed to parse JSON for {context or 'data'}: {str(e)}. Raw response: {text}"
-                    )
+            return await self._fetch_json_with_session(session, url, context)
+
+    @staticmethod
+    async def _fetch_json_with_session(
+        session: aiohttp.ClientSession, url: str, context: Optional[str]
+    ) -> Any:
+        async with session.get(url) as resp:
+            text = await resp.text()
+            if resp.status != 200:
+                raise RuntimeError(
+                    f"Failed to fetch {context or 'data'}: HTTP {resp.status} - {text}"
+                )
+            try:
+                return await resp.json()
+            except Exception as e:
+                raise RuntimeError(
+                    f"Failed to parse JSON for {context or 'data'}: {str(e)}. Raw response: {text}"
+                )
 
     # ------------------------- ACCOUNT ------------------------- #
 
@@ -91,24 +120,49 @@ class HederaMirrornodeServiceDefaultImpl(IHederaMirrornodeService):
             url, context=f"token balances for account {account_id}"
         )
 
-        # Fetch token symbols in parallel
-        tasks: list[Coroutine[Any, Any, TokenInfo]] = []
-        for token in res.get("tokens", []):
-            tid = token.get("token_id")
-            if tid:
-                tasks.append(self.get_token_info(tid))
+        # Fetch symbols that are not cached (or have expired) in parallel
+        token_ids: List[str] = [
+            token.get("token_id")
+            for token in res.get("tokens", [])
+            if token.get("token_id")
+        ]
+        missing: List[str] = [
+            tid
+            for tid in dict.fromkeys(token_ids)
+            if self._get_cached_token_symbol(tid) is None
+        ]
         token_infos: list[TokenInfo] = await asyncio.gather(
-            *tasks, return_exceptions=True
+            *(self.get_token_info(tid) for tid in missing), return_exceptions=True
         )
+        for tid, info in zip(missing, token_infos):
+            if isinstance(info, dict) and "symbol" in info:
+                self._cache_token_symbol(tid, info["symbol"])
 
-        for idx, info in enumerate(token_infos):
-            if isinstance(info, dict):
-                res["tokens"][idx]["symbol"] = info.get("symbol", "UNKNOWN")
-            else:
-                res["tokens"][idx]["symbol"] = "UNKNOWN"
+        for token in res.get("tokens", []):
+            token["symbol"] = (
+                self._get_cached_token_symbol(token.get("token_id")) or "UNKNOWN"
+            )
 
         return res
 
+    def _get_cached_token_symbol(self, token_id: Optional[str]) -> Optional[str]:
+        """Return the cached symbol of a token, or None if absent or expired."""
+        entry = self._token_symbols.get(token_id)
+        if entry is None:
+            return None
+        fetched_at, symbol = entry
+        if time.monotonic() - fetched_at >= TOKEN_SYMBOL_CACHE_TTL_SECONDS:
+            del self._token_symbols[token_id]
+            return None
+        return symbol
+
+    def _cache_token_symbol(self, token_id: str, symbol: str) -> None:
+        """Store a token symbol, evicting the oldest entry when the cache is full."""
+        self._token_symbols.pop(token_id, None)
+        if len(self._token_symbols) >= TOKEN_SYMBOL_CACHE_MAX_SIZE:
+            del self._token_symbols[next(iter(self._token_symbols))]
+        self._token_symbols[token_id] = (time.monotonic(), symbol)
+
     async def get_account_nfts(self, account_id: str) -> NftBalanceResponse:
         url: str = f"{self.base_url}/accounts/{account_id}/nfts"
         return await self._fetch_json(url, context=f"NFTs for account {account_id}")
@@ -1,9 +1,10 @@
 from typing import Optional, List, Union, Annotated, Dict, Tuple
 
 from hiero_sdk_python import AccountId, PublicKey, TokenId, TokenNftAllowance
+from hiero_sdk_python.tokens.supply_type import SupplyType
 from hiero_sdk_python.tokens.token_create_transaction import TokenParams, TokenKeys
 from hiero_sdk_python.tokens.token_transfer import TokenTransfer
-from pydantic import Field
+from pydantic import Field, model_validator
 
 from hedera_agent_kit_py.shared.parameter_schemas import (
     OptionalScheduledTransactionParams,
@@ -41,6 +42,21 @@ class CreateFungibleTokenParameters(OptionalScheduledTransactionParams):
         Field(description="Determines if the token supply key should be set."),
     ] = None
 
+    @model_validator(mode="after")
+    def _check_initial_supply_within_max(self) -> "CreateFungibleTokenParameters":
+        # Rejected by the network anyway; failing here saves the transaction round-trip.
+        # max_supply only caps finite tokens; infinite ones ignore it.
+        if (
+            self.supply_type == SupplyType.FINITE.value
+            and self.max_supply is not None
+            and self.initial_supply > self.max_supply
+        ):
+            raise ValueError(
+                f"Initial supply ({self.initial_supply}) cannot exceed "
+                f"max supply ({self.max_supply})"
+            )
+        return self
+
 
 class CreateFungibleTokenParametersNormalised(
     OptionalScheduledTransactionParamsNormalised
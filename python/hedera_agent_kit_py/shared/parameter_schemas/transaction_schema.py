@@ -1,9 +1,12 @@
 from typing import Optional, Annotated
 
-from pydantic import Field
+from pydantic import Field, field_validator
 
 from hedera_agent_kit_py.shared.parameter_schemas import BaseModelWithArbitraryTypes
 
+# Deletes every character a transaction ID may contain; anything left over is invalid
+_TRANSACTION_ID_CHARS_TABLE = str.maketrans("", "", "0123456789.-@")
+
 
 class TransactionRecordQueryParameters(BaseModelWithArbitraryTypes):
     transaction_id: Annotated[
@@ -24,6 +27,15 @@ class TransactionRecordQueryParameters(BaseModelWithArbitraryTypes):
         ),
     ] = None
 
+    @field_validator("transaction_id", mode="after")
+    @classmethod
+    def _check_transaction_id_chars(cls, value: str) -> str:
+        # LLM tool calls often carry surrounding whitespace
+        value = value.strip()
+        if not value or value.translate(_TRANSACTION_ID_CHARS_TABLE):
+            raise ValueError("Transaction ID may only contain digits, '.', '-' and '@'")
+        return value
+
 
 ## TODO: adapt to the Python SDK Transaction Constructor impl
 class TransactionRecordQueryParametersNormalised(TransactionRecordQueryParameters):
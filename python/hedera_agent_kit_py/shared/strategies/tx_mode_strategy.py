@@ -79,27 +79,21 @@ class ExecuteStrategy(TxModeStrategy):
 
         return json.dumps(response.to_dict(), indent=2)
 
-    async def handle(
-        self,
-        tx: Transaction,
-        client: Client,
-        context: Context,
-        post_process: Optional[Callable[[RawTransactionResponse], Any]] = None,
-    ) -> ExecutedTransactionToolResponse:
-        """Execute the transaction and construct an executed response.
+    @staticmethod
+    def raw_response_from_receipt(
+        receipt: TransactionReceipt,
+    ) -> RawTransactionResponse:
+        """Build the raw response for an executed transaction's receipt.
 
         Args:
-            tx: The transaction to execute.
-            client: Hedera client used to submit the transaction.
-            context: Runtime context (unused for direct execution).
-            post_process: Optional callback to convert the raw response to text.
+            receipt: The receipt returned by executing the transaction.
 
         Returns:
-            An `ExecutedTransactionToolResponse` with raw fields and a message.
-        """
-        post_process = post_process or self.default_post_process
-        receipt: TransactionReceipt = tx.execute(client)
+            A `RawTransactionResponse` with the IDs carried by the receipt.
 
+        Raises:
+            HederaTransactionError: If the receipt status is not SUCCESS.
+        """
         # Create a raw response object
         raw_transaction_response = RawTransactionResponse(
             status=ResponseCode(receipt.status).name,
@@ -116,6 +110,30 @@ class ExecuteStrategy(TxModeStrategy):
                 f"Transaction failed with status: {ResponseCode(receipt.status).name}. Transaction Id: {receipt.transaction_id}"
             )
 
+        return raw_transaction_response
+
+    async def handle(
+        self,
+        tx: Transaction,
+        client: Client,
+        context: Context,
+        post_process: Optional[Callable[[RawTransactionResponse], Any]] = None,
+    ) -> ExecutedTransactionToolResponse:
+        """Execute the transaction and construct an executed response.
+
+        Args:
+            tx: The transaction to execute.
+            client: Hedera client used to submit the transaction.
+            context: Runtime context (unused for direct execution).
+            post_process: Optional callback to convert the raw response to text.
+
+        Returns:
+            An `ExecutedTransactionToolResponse` with raw fields and a message.
+        """
+        post_process = post_process or self.default_post_process
+        receipt: TransactionReceipt = tx.execute(client)
+        raw_transaction_response = self.raw_response_from_receipt(receipt)
+
         # Normal success path
         return ExecutedTransactionToolResponse(
             raw=raw_transaction_response,
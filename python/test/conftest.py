@@ -1,8 +1,148 @@
+import asyncio
 import os
+import sys
+from functools import partial
 from pathlib import Path
+from typing import AsyncGenerator
 
+import aiohttp
 from dotenv import load_dotenv
 import pytest
+import pytest_asyncio
+from hiero_sdk_python import AccountId, Client, Hbar, PrivateKey
+from langchain_core.runnables import RunnableConfig
+
+from hedera_agent_kit_py.shared.hedera_utils.mirrornode import (
+    HederaMirrornodeServiceDefaultImpl,
+)
+from hedera_agent_kit_py.shared.hedera_utils.mirrornode.hedera_mirrornode_service_interface import (
+    IHederaMirrornodeService,
+)
+from hedera_agent_kit_py.shared.parameter_schemas import (
+    CreateAccountParametersNormalised,
+)
+from hedera_agent_kit_py.shared.utils import LedgerId
+from test import HederaOperationsWrapper
+from test.utils import account_exists, wait_for_mirror
+from test.utils.setup import get_operator_client_for_tests, get_custom_client
+from test.utils.teardown import return_hbars_and_delete_account
+
+# Funds every module sharing the executor account; leftovers are returned on teardown
+DEFAULT_EXECUTOR_BALANCE = Hbar(20, in_tinybars=False)
+
+
+def pytest_collection_modifyitems(items):
+    """Run every async test in the session event loop.
+
+    Session-scoped async fixtures (e.g. on-chain executor accounts) live in the
+    session loop, so the tests consuming them must run there as well.
+    """
+    session_loop_marker = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop_marker, append=False)
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run the test event loop on uvloop where it is available (not on Windows).
+
+    Overrides the pytest-asyncio fixture of the same name; the suite is dominated
+    by network round-trips, for which uvloop has lower per-await overhead.
+    """
+    if sys.platform == "win32":
+        return asyncio.DefaultEventLoopPolicy()
+
+    import uvloop
+
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
+async def mirrornode_service() -> AsyncGenerator[IHederaMirrornodeService, None]:
+    """Testnet mirror node service sharing one keep-alive HTTP session.
+
+    Mirror node reads and polls (e.g. ``wait_for_mirror``) reuse pooled
+    connections instead of opening a new TLS connection per request.
+    """
+    async with aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit_per_host=20, ttl_dns_cache=300)
+    ) as session:
+        yield HederaMirrornodeServiceDefaultImpl(LedgerId.TESTNET, session=session)
+
+
+@pytest.fixture(scope="session")
+def operator_client():
+    """Initialize operator client once per test session."""
+    client = get_operator_client_for_tests()
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def operator_wrapper(operator_client, mirrornode_service):
+    """Create a wrapper for operator client operations."""
+    return HederaOperationsWrapper(operator_client, mirrornode_service)
+
+
+@pytest.fixture(scope="session")
+async def executor_account(
+    operator_wrapper, operator_client, mirrornode_service
+) -> AsyncGenerator[tuple, None]:
+    """Create the executor account shared by the integration and e2e tests.
+
+    Shared: the executor account, its client and wrapper. Tests only spend from
+    it; the accounts, topics and recipients they act on are still created per
+    module or per test. Modules that modify the executor account itself
+    (e.g. account updates) create their own executor instead. It uses an ECDSA
+    key so that tests asserting on ECDSA submit/admin keys work against it.
+
+    Yields:
+        tuple: (account_id, private_key, client, wrapper)
+
+    Teardown:
+        Returns funds, deletes the account and closes its client.
+    """
+    executor_key_pair: PrivateKey = PrivateKey.generate_ecdsa()
+    executor_resp = await operator_wrapper.create_account(
+        CreateAccountParametersNormalised(
+            initial_balance=DEFAULT_EXECUTOR_BALANCE,
+            key=executor_key_pair.public_key(),
+        )
+    )
+
+    executor_account_id: AccountId = executor_resp.account_id
+    executor_client: Client = get_custom_client(executor_account_id, executor_key_pair)
+    executor_wrapper: HederaOperationsWrapper = HederaOperationsWrapper(
+        executor_client, mirrornode_service
+    )
+
+    # Tools resolving the default account read it from the mirror node
+    await wait_for_mirror(
+        partial(account_exists, operator_wrapper.mirrornode, executor_account_id)
+    )
+
+    yield executor_account_id, executor_key_pair, executor_client, executor_wrapper
+
+    await return_hbars_and_delete_account(
+        executor_wrapper,
+        executor_account_id,
+        operator_client.operator_account_id,
+    )
+    executor_client.close()
+
+
+@pytest.fixture
+def langchain_config(request) -> RunnableConfig:
+    """Provide a LangChain runnable config with a thread ID unique to the test.
+
+    The thread ID combines the pytest-xdist worker name with the test node ID, so
+    agents shared across tests (or workers) never mix checkpointed conversations.
+    """
+    worker_id = os.getenv("PYTEST_XDIST_WORKER", "master")
+    return RunnableConfig(
+        configurable={"thread_id": f"{worker_id}:{request.node.nodeid}"}
+    )
 
 
 @pytest.fixture(scope="session", autouse=True)
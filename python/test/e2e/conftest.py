@@ -0,0 +1,60 @@
+from typing import AsyncGenerator
+
+import pytest
+
+from test.utils import create_langchain_test_setup
+from test.utils.account_pool import AccountPool
+
+# ============================================================================
+# SESSION-LEVEL FIXTURES
+# ============================================================================
+
+
+@pytest.fixture(scope="session")
+async def executor_wrapper(executor_account):
+    """Provide just the executor wrapper from the executor_account fixture."""
+    _, _, _, wrapper = executor_account
+    return wrapper
+
+
+@pytest.fixture(scope="session")
+async def account_pool(executor_wrapper):
+    """Provide a pool of zero-balance accounts keyed with the executor key."""
+    pool = AccountPool(executor_wrapper)
+    await pool.warm()
+    yield pool
+    await pool.close()
+
+
+@pytest.fixture(scope="session")
+async def langchain_test_setup(executor_account):
+    """Set up LangChain agent and toolkit with the shared executor account."""
+    _, _, executor_client, _ = executor_account
+    setup = await create_langchain_test_setup(custom_client=executor_client)
+    yield setup
+    setup.cleanup()
+
+
+@pytest.fixture(scope="session")
+async def agent_executor(langchain_test_setup):
+    """Provide the LangChain agent executor."""
+    return langchain_test_setup.agent
+
+
+@pytest.fixture(scope="session")
+async def toolkit(langchain_test_setup):
+    """Provide the LangChain toolkit."""
+    return langchain_test_setup.toolkit
+
+
+# ============================================================================
+# FUNCTION-LEVEL FIXTURES
+# ============================================================================
+
+
+@pytest.fixture
+async def pooled_account(account_pool) -> AsyncGenerator[str, None]:
+    """Lend a pooled account to a test that modifies (but does not delete) it."""
+    account_id = await account_pool.acquire()
+    yield str(account_id)
+    account_pool.release(account_id)
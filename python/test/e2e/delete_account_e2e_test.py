@@ -1,143 +1,51 @@
-import pytest
-from hiero_sdk_python import Hbar, PrivateKey
-from langchain_core.runnables import RunnableConfig
-
-from hedera_agent_kit_py.shared.parameter_schemas import (
-    CreateAccountParametersNormalised,
-)
-from test import HederaOperationsWrapper
-from test.utils import create_langchain_test_setup
-from test.utils.general_utils import wait
-from test.utils.setup import get_operator_client_for_tests, get_custom_client
-from test.utils.teardown import return_hbars_and_delete_account
+from test.utils.agent_helpers import create_test_account, execute_agent_request
 from test.utils.verification import extract_tool_response
 
-DEFAULT_EXECUTOR_BALANCE = Hbar(10, in_tinybars=False)
 
-
-@pytest.fixture(scope="session")
-def operator_client():
-    return get_operator_client_for_tests()
-
-
-@pytest.fixture(scope="session")
-def operator_wrapper(operator_client):
-    return HederaOperationsWrapper(operator_client)
-
-
-@pytest.fixture
-async def executor_account(operator_wrapper, operator_client):
-    executor_key: PrivateKey = PrivateKey.generate_ed25519()
-    resp = await operator_wrapper.create_account(
-        CreateAccountParametersNormalised(
-            initial_balance=DEFAULT_EXECUTOR_BALANCE, key=executor_key.public_key()
-        )
-    )
-    executor_account_id = resp.account_id
-    executor_client = get_custom_client(executor_account_id, executor_key)
-    executor_wrapper = HederaOperationsWrapper(executor_client)
-
-    yield executor_account_id, executor_key, executor_client, executor_wrapper
-
-    await return_hbars_and_delete_account(
-        executor_wrapper, executor_account_id, operator_client.operator_account_id
-    )
-
-
-@pytest.fixture
-async def langchain_test_setup(executor_account):
-    _, _, executor_client, _ = executor_account
-    setup = await create_langchain_test_setup(custom_client=executor_client)
-    yield setup
-    setup.cleanup()
-
-
-@pytest.fixture
-async def agent_executor(langchain_test_setup):
-    return langchain_test_setup.agent
-
-
-@pytest.fixture
-async def executor_wrapper(executor_account):
-    _, _, _, wrapper = executor_account
-    return wrapper
-
-
-@pytest.fixture
-def langchain_config():
-    return RunnableConfig(configurable={"thread_id": "delete_account_e2e"})
-
-
-async def create_test_account(
-    executor_wrapper, executor_client, initial_balance_in_tinybar=0
-):
-    return await executor_wrapper.create_account(
-        CreateAccountParametersNormalised(
-            key=executor_client.operator_private_key.public_key(),
-            initial_balance=initial_balance_in_tinybar,
-        )
-    )
-
-
-@pytest.mark.asyncio
 async def test_delete_pre_created_account_default_transfer(
-    agent_executor, executor_wrapper, executor_account, langchain_config
+    agent_executor, account_pool, langchain_config
 ):
-    _, _, executor_client, _ = executor_account
-    resp = await create_test_account(executor_wrapper, executor_client)
-    target_account_id = str(resp.account_id)
+    target_account_id = str(await account_pool.acquire())
 
-    result = await agent_executor.ainvoke(
-        {
-            "messages": [
-                {"role": "user", "content": f"Delete the account {target_account_id}"}
-            ]
-        },
-        config=langchain_config,
+    result = await execute_agent_request(
+        agent_executor,
+        f"Delete the account {target_account_id}",
+        langchain_config,
+        tool_name="delete_account_tool",
     )
 
     observation = extract_tool_response(result, "delete_account_tool")
     assert "deleted" in observation.human_message.lower()
 
 
-@pytest.mark.asyncio
 async def test_delete_pre_created_account_with_explicit_transfer(
-    agent_executor, executor_wrapper, executor_account, langchain_config
+    agent_executor, account_pool, executor_account, langchain_config
 ):
     _, _, executor_client, _ = executor_account
-    resp = await create_test_account(executor_wrapper, executor_client)
-    target_account_id = str(resp.account_id)
+    target_account_id = str(await account_pool.acquire())
     transfer_account_id = str(executor_client.operator_account_id)
 
-    result = await agent_executor.ainvoke(
-        {
-            "messages": [
-                {
-                    "role": "user",
-                    "content": f"Delete the account {target_account_id} and transfer remaining balance to {transfer_account_id}",
-                }
-            ]
-        },
-        config=langchain_config,
+    result = await execute_agent_request(
+        agent_executor,
+        f"Delete the account {target_account_id} and transfer remaining balance to {transfer_account_id}",
+        langchain_config,
+        tool_name="delete_account_tool",
     )
 
     observation = extract_tool_response(result, "delete_account_tool")
     assert "deleted" in observation.human_message.lower()
 
 
-@pytest.mark.asyncio
 async def test_delete_non_existent_account(
     agent_executor, executor_wrapper, langchain_config
 ):
     fake_account_id = "0.0.999999999"
 
-    result = await agent_executor.ainvoke(
-        {
-            "messages": [
-                {"role": "user", "content": f"Delete the account {fake_account_id}"}
-            ]
-        },
-        config=langchain_config,
+    result = await execute_agent_request(
+        agent_executor,
+        f"Delete the account {fake_account_id}",
+        langchain_config,
+        tool_name="delete_account_tool",
     )
 
     observation = extract_tool_response(result, "delete_account_tool")
@@ -152,13 +60,12 @@ async def test_delete_non_existent_account(
     )
 
 
-@pytest.mark.asyncio
 async def test_delete_account_with_natural_language_variations(
     agent_executor, executor_wrapper, executor_account, langchain_config
 ):
     _, _, executor_client, _ = executor_account
     resp = await create_test_account(
-        executor_wrapper, executor_client, initial_balance_in_tinybar=5 * 10**8
+        executor_wrapper, initial_balance_in_tinybar=5 * 10**8
     )
     target_account_id = str(resp.account_id)
 
@@ -166,23 +73,16 @@ async def test_delete_account_with_natural_language_variations(
         str(executor_client.operator_account_id)
     )
 
-    result = await agent_executor.ainvoke(
-        {
-            "messages": [
-                {
-                    "role": "user",
-                    "content": f"Remove account id {target_account_id} and send balance to {executor_client.operator_account_id}",
-                }
-            ]
-        },
-        config=langchain_config,
+    result = await execute_agent_request(
+        agent_executor,
+        f"Remove account id {target_account_id} and send balance to {executor_client.operator_account_id}",
+        langchain_config,
+        tool_name="delete_account_tool",
     )
 
     observation = extract_tool_response(result, "delete_account_tool")
     assert "deleted" in observation.human_message.lower()
 
-    await wait(5000)
-
     operator_balance_after = executor_wrapper.get_account_hbar_balance(
         str(executor_client.operator_account_id)
     )
@@ -4,98 +4,19 @@ This module provides full E2E testing from simulated user input through the
 LangChain agent, Hedera client interaction, to on-chain balance queries.
 """
 
-from decimal import Decimal
-from typing import AsyncGenerator, Any, cast
-import pytest
+from functools import partial
+from typing import Any, cast
 
-from hiero_sdk_python import PrivateKey, Hbar
-from langchain_core.runnables import RunnableConfig
+from hiero_sdk_python import Hbar
 
 from hedera_agent_kit_py.shared.models import ToolResponse
 from hedera_agent_kit_py.shared.parameter_schemas import (
     CreateAccountParametersNormalised,
 )
-from test import HederaOperationsWrapper
-from test.utils import create_langchain_test_setup
-from test.utils.setup import (
-    get_operator_client_for_tests,
-    get_custom_client,
-    MIRROR_NODE_WAITING_TIME,
-)
+from test.utils.agent_helpers import execute_agent_request
 from test.utils.verification import extract_tool_response
 from test.utils.teardown import return_hbars_and_delete_account
-from test.utils import wait
-
-DEFAULT_EXECUTOR_BALANCE = Hbar(5, in_tinybars=False)
-
-# ============================================================================
-# SESSION FIXTURES
-# ============================================================================
-
-
-@pytest.fixture(scope="session")
-def operator_client():
-    """Operator client for the session."""
-    return get_operator_client_for_tests()
-
-
-@pytest.fixture(scope="session")
-def operator_wrapper(operator_client):
-    """Operator wrapper for account operations."""
-    return HederaOperationsWrapper(operator_client)
-
-
-# ============================================================================
-# FUNCTION FIXTURES
-# ============================================================================
-
-
-@pytest.fixture
-async def executor_account(
-    operator_wrapper, operator_client
-) -> AsyncGenerator[tuple, None]:
-    """Create a temporary executor account used as agent operator."""
-    executor_key = PrivateKey.generate_ed25519()
-    executor_resp = await operator_wrapper.create_account(
-        CreateAccountParametersNormalised(
-            initial_balance=DEFAULT_EXECUTOR_BALANCE,
-            key=executor_key.public_key(),
-        )
-    )
-    executor_account_id = executor_resp.account_id
-    executor_client = get_custom_client(executor_account_id, executor_key)
-    executor_wrapper = HederaOperationsWrapper(executor_client)
-
-    await wait(MIRROR_NODE_WAITING_TIME)
-
-    yield executor_account_id, executor_key, executor_client, executor_wrapper
-
-    await return_hbars_and_delete_account(
-        executor_wrapper,
-        executor_account_id,
-        operator_client.operator_account_id,
-    )
-
-
-@pytest.fixture
-async def langchain_test_setup(executor_account):
-    """Initialize LangChain agent and toolkit using executor client as operator."""
-    _, _, executor_client, _ = executor_account
-    setup = await create_langchain_test_setup(custom_client=executor_client)
-    yield setup
-    setup.cleanup()
-
-
-@pytest.fixture
-async def agent_executor(langchain_test_setup):
-    """Provide LangChain agent executor."""
-    return langchain_test_setup.agent
-
-
-@pytest.fixture
-def langchain_config():
-    """LangChain runnable config."""
-    return RunnableConfig(configurable={"thread_id": "1"})
+from test.utils import account_exists, wait_for_mirror
 
 
 # ============================================================================
@@ -103,16 +24,6 @@ def langchain_config():
 # ============================================================================
 
 
-async def execute_get_hbar_balance(
-    agent_executor, input_text: str, config: RunnableConfig
-):
-    """Execute balance query through the agent."""
-    return await agent_executor.ainvoke(
-        {"messages": [{"role": "user", "content": input_text}]},
-        config=config,
-    )
-
-
 def extract_balance_info(agent_result: dict[str, Any]) -> tuple[str, str]:
     """Extract account ID and balance from the agent result."""
     observation = extract_tool_response(agent_result, "get_hbar_balance_query_tool")
@@ -134,7 +45,6 @@ def extract_balance_info(agent_result: dict[str, Any]) -> tuple[str, str]:
 # ============================================================================
 
 
-@pytest.mark.asyncio
 async def test_get_hbar_balance_for_executor_account(
     agent_executor,
     executor_account,
@@ -146,9 +56,22 @@ async def test_get_hbar_balance_for_executor_account(
 
     expected_balance = executor_wrapper.get_account_hbar_balance(executor_id_str)
 
+    # The executor account is shared across the session; let the mirror node
+    # (queried by the tool) catch up with its latest balance first
+    async def mirror_balance_is_current() -> bool:
+        mirror_balance = await executor_wrapper.mirrornode.get_account_hbar_balance(
+            executor_id_str
+        )
+        return mirror_balance == expected_balance
+
+    await wait_for_mirror(mirror_balance_is_current)
+
     input_text = f"What is the HBAR balance of {executor_id_str}?"
-    result = await execute_get_hbar_balance(
-        agent_executor, input_text, langchain_config
+    result = await execute_agent_request(
+        agent_executor,
+        input_text,
+        langchain_config,
+        tool_name="get_hbar_balance_query_tool",
     )
     observation = extract_tool_response(result, "get_hbar_balance_query_tool")
 
@@ -159,7 +82,6 @@ async def test_get_hbar_balance_for_executor_account(
     assert "HBAR Balance" in observation.human_message
 
 
-@pytest.mark.asyncio
 async def test_get_hbar_balance_for_specific_account_nonzero(
     agent_executor,
     executor_account,
@@ -172,15 +94,20 @@ async def test_get_hbar_balance_for_specific_account_nonzero(
     resp = await executor_wrapper.create_account(
         CreateAccountParametersNormalised(
             initial_balance=Hbar(hbar_balance, in_tinybars=False),
-            key=executor_wrapper.client.operator_private_key.public_key(),
+            key=executor_wrapper.operator_public_key,
         )
     )
     account_id = resp.account_id
-    await wait(MIRROR_NODE_WAITING_TIME)
+    await wait_for_mirror(
+        partial(account_exists, executor_wrapper.mirrornode, account_id)
+    )
 
     input_text = f"What is the HBAR balance of {account_id}?"
-    result = await execute_get_hbar_balance(
-        agent_executor, input_text, langchain_config
+    result = await execute_agent_request(
+        agent_executor,
+        input_text,
+        langchain_config,
+        tool_name="get_hbar_balance_query_tool",
     )
     observation = extract_tool_response(result, "get_hbar_balance_query_tool")
 
@@ -195,7 +122,6 @@ async def test_get_hbar_balance_for_specific_account_nonzero(
     )
 
 
-@pytest.mark.asyncio
 async def test_get_hbar_balance_for_specific_account_zero_balance(
     agent_executor,
     executor_account,
@@ -207,15 +133,20 @@ async def test_get_hbar_balance_for_specific_account_zero_balance(
     resp = await executor_wrapper.create_account(
         CreateAccountParametersNormalised(
             initial_balance=Hbar(0),
-            key=executor_wrapper.client.operator_private_key.public_key(),
+            key=executor_wrapper.operator_public_key,
         )
     )
     account_id = resp.account_id
-    await wait(MIRROR_NODE_WAITING_TIME)
+    await wait_for_mirror(
+        partial(account_exists, executor_wrapper.mirrornode, account_id)
+    )
 
     input_text = f"What is the HBAR balance of {account_id}?"
-    result = await execute_get_hbar_balance(
-        agent_executor, input_text, langchain_config
+    result = await execute_agent_request(
+        agent_executor,
+        input_text,
+        langchain_config,
+        tool_name="get_hbar_balance_query_tool",
     )
     observation = extract_tool_response(result, "get_hbar_balance_query_tool")
 
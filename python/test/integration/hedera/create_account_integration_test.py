@@ -7,7 +7,7 @@ omitting the LLM and focusing on testing logic and on-chain execution.
 from typing import cast
 
 import pytest
-from hiero_sdk_python import PrivateKey, Hbar, PublicKey, Client
+from hiero_sdk_python import PublicKey, Client
 
 from hedera_agent_kit_py.plugins.core_account_plugin import CreateAccountTool
 from hedera_agent_kit_py.shared import AgentMode
@@ -18,36 +18,20 @@ from hedera_agent_kit_py.shared.models import (
 )
 from hedera_agent_kit_py.shared.parameter_schemas import (
     CreateAccountParameters,
-    CreateAccountParametersNormalised,
     SchedulingParams,
 )
 from test import HederaOperationsWrapper
-from test.utils.setup import get_operator_client_for_tests, get_custom_client
 from test.utils.teardown.account_teardown import return_hbars_and_delete_account
 
 
 @pytest.fixture(scope="module")
-async def setup_accounts():
-    """Setup operator and executor accounts for tests."""
-    operator_client = get_operator_client_for_tests()
-    operator_wrapper = HederaOperationsWrapper(operator_client)
-
-    # Create an executor account
-    executor_key_pair = PrivateKey.generate_ed25519()
-    executor_resp = await operator_wrapper.create_account(
-        CreateAccountParametersNormalised(
-            initial_balance=Hbar(5, in_tinybars=False),
-            key=executor_key_pair.public_key(),
-        )
-    )
-    executor_account_id = executor_resp.account_id
-
-    executor_client = get_custom_client(executor_account_id, executor_key_pair)
-    executor_wrapper = HederaOperationsWrapper(executor_client)
+def setup_accounts(operator_client, operator_wrapper, executor_account):
+    """Expose the shared operator and executor accounts to the tests."""
+    executor_account_id, _, executor_client, executor_wrapper = executor_account
 
     context = Context(mode=AgentMode.AUTONOMOUS, account_id=str(executor_account_id))
 
-    yield {
+    return {
         "operator_client": operator_client,
         "executor_client": executor_client,
         "executor_wrapper": executor_wrapper,
@@ -55,16 +39,7 @@ async def setup_accounts():
         "context": context,
     }
 
-    # Cleanup
-    await return_hbars_and_delete_account(
-        executor_wrapper, executor_account_id, operator_client.operator_account_id
-    )
 
-    executor_client.close()
-    operator_client.close()
-
-
-@pytest.mark.asyncio
 async def test_create_account_with_executor_public_key_by_default(setup_accounts):
     """Test creating an account with an executor public key by default."""
     executor_client: Client = setup_accounts["executor_client"]
@@ -98,7 +73,6 @@ async def test_create_account_with_executor_public_key_by_default(setup_accounts
     )
 
 
-@pytest.mark.asyncio
 async def test_create_account_with_initial_balance_and_memo(setup_accounts):
     """Test creating an account with initial balance and memo."""
     executor_client: Client = setup_accounts["executor_client"]
@@ -138,7 +112,6 @@ async def test_create_account_with_initial_balance_and_memo(setup_accounts):
     )
 
 
-@pytest.mark.asyncio
 async def test_create_account_with_explicit_public_key(setup_accounts):
     """Test creating an account with an explicit public key."""
     executor_client: Client = setup_accounts["executor_client"]
@@ -146,7 +119,7 @@ async def test_create_account_with_explicit_public_key(setup_accounts):
     executor_wrapper: HederaOperationsWrapper = setup_accounts["executor_wrapper"]
     context: Context = setup_accounts["context"]
 
-    public_key: PublicKey = executor_client.operator_private_key.public_key()
+    public_key: PublicKey = executor_wrapper.operator_public_key
     params = CreateAccountParameters(
         public_key=public_key.to_string_der(),
     )
@@ -167,13 +140,13 @@ async def test_create_account_with_explicit_public_key(setup_accounts):
     )
 
 
-@pytest.mark.asyncio
 async def test_schedule_create_account_transaction(setup_accounts):
     """Test scheduling a create account transaction with explicit public key."""
     executor_client: Client = setup_accounts["executor_client"]
+    executor_wrapper: HederaOperationsWrapper = setup_accounts["executor_wrapper"]
     context: Context = setup_accounts["context"]
 
-    public_key: PublicKey = executor_client.operator_private_key.public_key()
+    public_key: PublicKey = executor_wrapper.operator_public_key
     params = CreateAccountParameters(
         public_key=public_key.to_string_der(),
         scheduling_params=SchedulingParams(is_scheduled=True, wait_for_expiry=False),
@@ -188,7 +161,6 @@ async def test_schedule_create_account_transaction(setup_accounts):
     assert "Scheduled transaction created successfully" in result.human_message
 
 
-@pytest.mark.asyncio
 async def test_fail_with_invalid_public_key(setup_accounts):
     """Test that creation fails with an invalid public key."""
     executor_client: Client = setup_accounts["executor_client"]
@@ -205,7 +177,6 @@ async def test_fail_with_invalid_public_key(setup_accounts):
     assert "Failed to create account" in result.human_message
 
 
-@pytest.mark.asyncio
 async def test_fail_with_negative_initial_balance(setup_accounts):
     """Test that creation fails with a negative initial balance."""
     executor_client: Client = setup_accounts["executor_client"]
@@ -8,7 +8,7 @@ from secrets import token_urlsafe
 from typing import cast
 
 import pytest
-from hiero_sdk_python import Client, PublicKey, client, PrivateKey, Hbar
+from hiero_sdk_python import Client, PublicKey, client
 
 from hedera_agent_kit_py.plugins.core_consensus_plugin import CreateTopicTool
 from hedera_agent_kit_py.shared import AgentMode
@@ -19,50 +19,24 @@ from hedera_agent_kit_py.shared.models import (
 )
 from hedera_agent_kit_py.shared.parameter_schemas import (
     CreateTopicParameters,
-    DeleteAccountParametersNormalised,
-    CreateAccountParametersNormalised,
 )
 from test import HederaOperationsWrapper
-from test.utils.setup import get_operator_client_for_tests, get_custom_client
 
 
 @pytest.fixture(scope="module")
-async def setup_environment():
-    """Setup Hedera operator client and context for tests."""
-    operator_client = get_operator_client_for_tests()
-    operator_wrapper = HederaOperationsWrapper(operator_client)
-
-    # Create an executor account
-    executor_key_pair = PrivateKey.generate_ecdsa()
-    executor_resp = await operator_wrapper.create_account(
-        CreateAccountParametersNormalised(
-            initial_balance=Hbar(5, in_tinybars=False),
-            key=executor_key_pair.public_key(),
-        )
-    )
-    executor_account_id = executor_resp.account_id
-
-    executor_client = get_custom_client(executor_account_id, executor_key_pair)
-    executor_wrapper = HederaOperationsWrapper(executor_client)
+def setup_environment(executor_account):
+    """Expose the shared executor account and its context to the tests."""
+    executor_account_id, _, executor_client, executor_wrapper = executor_account
 
     context = Context(mode=AgentMode.AUTONOMOUS, account_id=str(executor_account_id))
 
-    yield {
+    return {
         "executor_client": executor_client,
         "executor_wrapper": executor_wrapper,
         "context": context,
     }
 
-    operator_client.close()
-    await executor_wrapper.delete_account(
-        DeleteAccountParametersNormalised(
-            account_id=executor_account_id,
-            transfer_account_id=operator_client.operator_account_id,
-        )
-    )
-
 
-@pytest.mark.asyncio
 async def test_create_topic_with_default_params(setup_environment):
     """Test creating a topic with default parameters."""
     client: Client = setup_environment["executor_client"]
@@ -86,7 +60,6 @@ async def test_create_topic_with_default_params(setup_environment):
     assert topic_info.submit_key is None
 
 
-@pytest.mark.asyncio
 async def test_create_topic_with_memo_and_submit_key(setup_environment):
     """Test creating a topic with a memo and submit key enabled."""
     client: Client = setup_environment["executor_client"]
@@ -113,7 +86,6 @@ async def test_create_topic_with_memo_and_submit_key(setup_environment):
     )
 
 
-@pytest.mark.asyncio
 async def test_create_topic_with_empty_memo(setup_environment):
     """Test creating a topic with an empty string memo."""
     client: Client = setup_environment["executor_client"]
@@ -1,7 +1,7 @@
 from typing import cast
 
 import pytest
-from hiero_sdk_python import Client, PrivateKey, Hbar
+from hiero_sdk_python import Client, Hbar
 
 from hedera_agent_kit_py.plugins.core_account_plugin import DeleteAccountTool
 from hedera_agent_kit_py.shared import AgentMode
@@ -15,29 +15,15 @@ from hedera_agent_kit_py.shared.parameter_schemas import (
     CreateAccountParametersNormalised,
 )
 from test import HederaOperationsWrapper
-from test.utils.setup import get_operator_client_for_tests, get_custom_client
-from test.utils.teardown.account_teardown import return_hbars_and_delete_account
 
 
 @pytest.fixture(scope="module")
-async def setup_accounts():
-    operator_client = get_operator_client_for_tests()
-    operator_wrapper = HederaOperationsWrapper(operator_client)
-
-    executor_key_pair = PrivateKey.generate_ed25519()
-    executor_resp = await operator_wrapper.create_account(
-        CreateAccountParametersNormalised(
-            initial_balance=Hbar(20, in_tinybars=False),
-            key=executor_key_pair.public_key(),
-        )
-    )
-    executor_account_id = executor_resp.account_id
-    executor_client = get_custom_client(executor_account_id, executor_key_pair)
-    executor_wrapper = HederaOperationsWrapper(executor_client)
+def setup_accounts(operator_client, operator_wrapper, executor_account):
+    executor_account_id, _, executor_client, executor_wrapper = executor_account
 
     context = Context(mode=AgentMode.AUTONOMOUS, account_id=str(executor_account_id))
 
-    yield {
+    return {
         "operator_client": operator_client,
         "operator_wrapper": operator_wrapper,
         "executor_client": executor_client,
@@ -45,32 +31,23 @@ async def setup_accounts():
         "context": context,
     }
 
-    await return_hbars_and_delete_account(
-        executor_wrapper, executor_account_id, operator_client.operator_account_id
-    )
-    executor_client.close()
-    operator_client.close()
-
 
-async def create_temp_account(
-    executor_wrapper: HederaOperationsWrapper, executor_client: Client
-):
+async def create_temp_account(executor_wrapper: HederaOperationsWrapper):
     resp = await executor_wrapper.create_account(
         CreateAccountParametersNormalised(
             initial_balance=Hbar(5, in_tinybars=False),
-            key=executor_client.operator_private_key.public_key(),
+            key=executor_wrapper.operator_public_key,
         )
     )
     return resp.account_id
 
 
-@pytest.mark.asyncio
 async def test_delete_account_transfers_balance_to_executor(setup_accounts):
     executor_client: Client = setup_accounts["executor_client"]
     executor_wrapper: HederaOperationsWrapper = setup_accounts["executor_wrapper"]
     context: Context = setup_accounts["context"]
 
-    account_id = await create_temp_account(executor_wrapper, executor_client)
+    account_id = await create_temp_account(executor_wrapper)
 
     tool = DeleteAccountTool(context)
     params = DeleteAccountParameters(account_id=str(account_id))
@@ -82,14 +59,13 @@ async def test_delete_account_transfers_balance_to_executor(setup_accounts):
     assert exec_result.raw.status == "SUCCESS"
 
 
-@pytest.mark.asyncio
 async def test_delete_account_transfers_to_specified_account(setup_accounts):
     executor_client: Client = setup_accounts["executor_client"]
     operator_client: Client = setup_accounts["operator_client"]
     executor_wrapper: HederaOperationsWrapper = setup_accounts["executor_wrapper"]
     context: Context = setup_accounts["context"]
 
-    account_id = await create_temp_account(executor_wrapper, executor_client)
+    account_id = await create_temp_account(executor_wrapper)
     transfer_to = str(operator_client.operator_account_id)
 
     tool = DeleteAccountTool(context)
@@ -103,7 +79,6 @@ async def test_delete_account_transfers_to_specified_account(setup_accounts):
     assert exec_result.raw.status == "SUCCESS"
 
 
-@pytest.mark.asyncio
 async def test_delete_nonexistent_account_should_fail(setup_accounts):
     executor_client: Client = setup_accounts["executor_client"]
     context: Context = setup_accounts["context"]
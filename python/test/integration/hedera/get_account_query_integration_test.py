@@ -1,3 +1,5 @@
+from functools import partial
+
 import pytest
 from hiero_sdk_python import PrivateKey
 
@@ -8,24 +10,15 @@ from hedera_agent_kit_py.shared.parameter_schemas import (
     AccountQueryParameters,
     CreateAccountParametersNormalised,
 )
-from test import HederaOperationsWrapper, wait
-from test.utils.setup import (
-    get_operator_client_for_tests,
-    get_custom_client,
-    MIRROR_NODE_WAITING_TIME,
-)
+from test.utils import account_exists, wait_for_mirror
 from hedera_agent_kit_py.shared.models import ToolResponse
 
 
 @pytest.fixture(scope="module")
-async def setup_operator():
-    client = get_operator_client_for_tests()
-    wrapper = HederaOperationsWrapper(client)
-    yield {"client": client, "wrapper": wrapper}
-    client.close()
+def setup_operator(operator_client, operator_wrapper):
+    return {"client": operator_client, "wrapper": operator_wrapper}
 
 
-@pytest.mark.asyncio
 async def test_get_account_info_for_valid_account(setup_operator):
     operator_client = setup_operator["client"]
     operator_wrapper = setup_operator["wrapper"]
@@ -38,13 +31,12 @@ async def test_get_account_info_for_valid_account(setup_operator):
         )
     )
     created_account_id = created_resp.account_id
-    await wait(MIRROR_NODE_WAITING_TIME)
-
-    custom_client = get_custom_client(created_account_id, private_key)
-    context = Context(
-        mode=AgentMode.AUTONOMOUS, account_id=str(custom_client.operator_account_id)
+    await wait_for_mirror(
+        partial(account_exists, operator_wrapper.mirrornode, created_account_id)
     )
 
+    context = Context(mode=AgentMode.AUTONOMOUS, account_id=str(created_account_id))
+
     tool = GetAccountQueryTool(context)
     params = AccountQueryParameters(account_id=str(created_account_id))
     result: ToolResponse = await tool.execute(operator_client, context, params)
@@ -57,10 +49,7 @@ async def test_get_account_info_for_valid_account(setup_operator):
     assert "Public Key:" in result.human_message
     assert "EVM address:" in result.human_message
 
-    custom_client.close()
-
 
-@pytest.mark.asyncio
 async def test_get_account_info_for_nonexistent_account(setup_operator):
     operator_client = setup_operator["client"]
     context = Context(
@@ -74,7 +63,6 @@ async def test_get_account_info_for_nonexistent_account(setup_operator):
     assert "Failed to get account query" in result.human_message
 
 
-@pytest.mark.asyncio
 async def test_get_account_info_for_operator_account(setup_operator):
     operator_client = setup_operator["client"]
     context = Context(
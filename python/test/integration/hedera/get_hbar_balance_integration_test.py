@@ -5,6 +5,9 @@ the Hedera Agent Kit. It covers successful balance retrieval, default account
 fallback, and error handling for non-existent accounts.
 """
 
+from functools import partial
+import asyncio
+
 import pytest
 from decimal import Decimal
 
@@ -20,40 +23,44 @@ from hedera_agent_kit_py.shared.parameter_schemas import (
     DeleteAccountParametersNormalised,
 )
 from test import HederaOperationsWrapper
-from test.utils import wait
-from test.utils.setup import (
-    get_operator_client_for_tests,
-    get_custom_client,
-    MIRROR_NODE_WAITING_TIME,
-)
+from test.utils import account_exists, wait_for_mirror
+from test.utils.setup import get_custom_client
 
 
 @pytest.fixture(scope="module")
-async def setup_environment():
+async def setup_environment(operator_client, operator_wrapper, mirrornode_service):
     """Setup operator and executor clients for balance query tests."""
-    operator_client = get_operator_client_for_tests()
-    operator_wrapper = HederaOperationsWrapper(operator_client)
 
-    # Create an executor account
+    # Create the executor and recipient accounts concurrently; both are keyed with
+    # the executor key, so the executor can later delete the recipient
     executor_key = PrivateKey.generate_ecdsa()
-    executor_resp = await operator_wrapper.create_account(
-        CreateAccountParametersNormalised(
-            key=executor_key.public_key(), initial_balance=Hbar(5, in_tinybars=False)
-        )
+    executor_resp, recipient_resp = await asyncio.gather(
+        operator_wrapper.create_account(
+            CreateAccountParametersNormalised(
+                key=executor_key.public_key(),
+                initial_balance=Hbar(5, in_tinybars=False),
+            )
+        ),
+        operator_wrapper.create_account(
+            CreateAccountParametersNormalised(
+                key=executor_key.public_key(),
+                initial_balance=Hbar(1, in_tinybars=False),
+            )
+        ),
     )
     executor_account_id = executor_resp.account_id
+    recipient_account_id = recipient_resp.account_id
     executor_client = get_custom_client(executor_account_id, executor_key)
-    executor_wrapper = HederaOperationsWrapper(executor_client)
-
-    # Create recipient account via executor
-    recipient_resp = await executor_wrapper.create_account(
-        CreateAccountParametersNormalised(
-            key=executor_key.public_key(), initial_balance=Hbar(1, in_tinybars=False)
-        )
+    executor_wrapper = HederaOperationsWrapper(executor_client, mirrornode_service)
+
+    await asyncio.gather(
+        wait_for_mirror(
+            partial(account_exists, operator_wrapper.mirrornode, executor_account_id)
+        ),
+        wait_for_mirror(
+            partial(account_exists, operator_wrapper.mirrornode, recipient_account_id)
+        ),
     )
-    recipient_account_id = recipient_resp.account_id
-
-    await wait(MIRROR_NODE_WAITING_TIME)
 
     context = Context(mode=AgentMode.AUTONOMOUS, account_id=str(executor_account_id))
 
@@ -81,10 +88,8 @@ async def setup_environment():
     )
 
     executor_client.close()
-    operator_client.close()
 
 
-@pytest.mark.asyncio
 async def test_get_balance_for_recipient_account(setup_environment):
     """Test retrieving HBAR balance for a specific account."""
     executor_client: Client = setup_environment["executor_client"]
@@ -103,7 +108,6 @@ async def test_get_balance_for_recipient_account(setup_environment):
     assert Decimal(result.extra["balance"]) == Decimal("100000000")
 
 
-@pytest.mark.asyncio
 async def test_get_balance_default_executor_account(setup_environment):
     """Test querying balance with no account_id provided (uses default from context)."""
     executor_client: Client = setup_environment["executor_client"]
@@ -124,7 +128,6 @@ async def test_get_balance_default_executor_account(setup_environment):
     assert Decimal(result.extra["balance"]) == expected_balance
 
 
-@pytest.mark.asyncio
 async def test_get_balance_non_existent_account(setup_environment):
     """Test querying a non-existent account and expecting a failure response."""
     executor_client: Client = setup_environment["executor_client"]
@@ -1,7 +1,7 @@
+import asyncio
 from decimal import Decimal
 
 import pytest
-from hiero_sdk_python import PrivateKey, Hbar
 
 from hedera_agent_kit_py.plugins.core_account_plugin import TransferHbarTool
 from hedera_agent_kit_py.shared import AgentMode
@@ -13,42 +13,22 @@ from hedera_agent_kit_py.shared.parameter_schemas import (
     TransferHbarParameters,
     TransferHbarEntry,
 )
-from test import HederaOperationsWrapper
-from test.utils.setup import get_operator_client_for_tests, get_custom_client
 from test.utils.teardown.account_teardown import return_hbars_and_delete_account
 
 
 @pytest.fixture(scope="module")
-async def setup_accounts():
-    operator_client = get_operator_client_for_tests()
-    operator_wrapper = HederaOperationsWrapper(operator_client)
-
-    # Create an executor account
-    executor_key_pair = PrivateKey.generate_ed25519()
-    executor_resp = await operator_wrapper.create_account(
-        CreateAccountParametersNormalised(
-            initial_balance=Hbar(5, in_tinybars=False),
-            key=executor_key_pair.public_key(),
-        )
-    )
-    executor_account_id = executor_resp.account_id
-
-    executor_client = get_custom_client(executor_account_id, executor_key_pair)
-    executor_wrapper = HederaOperationsWrapper(executor_client)
+async def setup_accounts(operator_client, operator_wrapper, executor_account):
+    executor_account_id, _, executor_client, executor_wrapper = executor_account
 
-    # Create recipients
-    recipient_resp = await executor_wrapper.create_account(
-        CreateAccountParametersNormalised(
-            initial_balance=0, key=operator_client.operator_private_key.public_key()
-        )
+    # Create recipients (independent, so submitted concurrently)
+    recipient_params = CreateAccountParametersNormalised(
+        initial_balance=0, key=operator_wrapper.operator_public_key
     )
-    recipient_account_id = recipient_resp.account_id
-
-    recipient_resp2 = await executor_wrapper.create_account(
-        CreateAccountParametersNormalised(
-            initial_balance=0, key=operator_client.operator_private_key.public_key()
-        )
+    recipient_resp, recipient_resp2 = await asyncio.gather(
+        executor_wrapper.create_account(recipient_params),
+        executor_wrapper.create_account(recipient_params),
     )
+    recipient_account_id = recipient_resp.account_id
     recipient_account_id2 = recipient_resp2.account_id
 
     context = Context(mode=AgentMode.AUTONOMOUS, account_id=str(executor_account_id))
@@ -63,29 +43,24 @@ async def setup_accounts():
         "context": context,
     }
 
-    # Cleanup
-    await return_hbars_and_delete_account(
-        operator_wrapper, recipient_account_id, operator_client.operator_account_id
+    # Cleanup (each recipient returns its funds to the operator, so run concurrently)
+    await asyncio.gather(
+        return_hbars_and_delete_account(
+            operator_wrapper, recipient_account_id, operator_client.operator_account_id
+        ),
+        return_hbars_and_delete_account(
+            operator_wrapper, recipient_account_id2, operator_client.operator_account_id
+        ),
     )
-    await return_hbars_and_delete_account(
-        operator_wrapper, recipient_account_id2, operator_client.operator_account_id
-    )
-    await return_hbars_and_delete_account(
-        executor_wrapper, executor_account_id, operator_client.operator_account_id
-    )
-
-    executor_client.close()
-    operator_client.close()
 
 
-@pytest.mark.asyncio
 async def test_single_hbar_transfer(setup_accounts):
     w = setup_accounts["executor_wrapper"]
     executor_client = setup_accounts["executor_client"]
     recipient = setup_accounts["recipient_account_id"]
     context = setup_accounts["context"]
 
-    balance_before = w.get_account_hbar_balance(str(recipient))
+    balance_before = await w.aget_account_hbar_balance(str(recipient))
     amount = 0.1
 
     tool = TransferHbarTool(context)
@@ -97,11 +72,10 @@ async def test_single_hbar_transfer(setup_accounts):
     )
     await tool.execute(executor_client, context, params)
 
-    balance_after = w.get_account_hbar_balance(str(recipient))
+    balance_after = await w.aget_account_hbar_balance(str(recipient))
     assert balance_after - balance_before == to_tinybars(Decimal(amount))
 
 
-@pytest.mark.asyncio
 async def test_multiple_hbar_transfer(setup_accounts):
     w = setup_accounts["executor_wrapper"]
     executor_client = setup_accounts["executor_client"]
@@ -109,8 +83,10 @@ async def test_multiple_hbar_transfer(setup_accounts):
     recipient2 = setup_accounts["recipient_account_id2"]
     context = setup_accounts["context"]
 
-    balance_before1 = w.get_account_hbar_balance(str(recipient1))
-    balance_before2 = w.get_account_hbar_balance(str(recipient2))
+    balance_before1, balance_before2 = await asyncio.gather(
+        w.aget_account_hbar_balance(str(recipient1)),
+        w.aget_account_hbar_balance(str(recipient2)),
+    )
 
     tool = TransferHbarTool(context)
     params = TransferHbarParameters(
@@ -122,20 +98,21 @@ async def test_multiple_hbar_transfer(setup_accounts):
     )
     await tool.execute(executor_client, context, params)
 
-    balance_after1 = w.get_account_hbar_balance(str(recipient1))
-    balance_after2 = w.get_account_hbar_balance(str(recipient2))
+    balance_after1, balance_after2 = await asyncio.gather(
+        w.aget_account_hbar_balance(str(recipient1)),
+        w.aget_account_hbar_balance(str(recipient2)),
+    )
     assert balance_after1 - balance_before1 == to_tinybars(Decimal(0.05))
     assert balance_after2 - balance_before2 == to_tinybars(Decimal(0.05))
 
 
-@pytest.mark.asyncio
 async def test_transfer_with_explicit_source(setup_accounts):
     w = setup_accounts["executor_wrapper"]
     executor_client = setup_accounts["executor_client"]
     recipient = setup_accounts["recipient_account_id"]
     context = setup_accounts["context"]
 
-    balance_before = w.get_account_hbar_balance(str(recipient))
+    balance_before = await w.aget_account_hbar_balance(str(recipient))
     amount = 0.1
 
     tool = TransferHbarTool(context)
@@ -146,18 +123,17 @@ async def test_transfer_with_explicit_source(setup_accounts):
     )
     await tool.execute(executor_client, context, params)
 
-    balance_after = w.get_account_hbar_balance(str(recipient))
+    balance_after = await w.aget_account_hbar_balance(str(recipient))
     assert balance_after - balance_before == to_tinybars(Decimal(amount))
 
 
-@pytest.mark.asyncio
 async def test_transfer_without_memo(setup_accounts):
     w = setup_accounts["executor_wrapper"]
     executor_client = setup_accounts["executor_client"]
     recipient = setup_accounts["recipient_account_id"]
     context = setup_accounts["context"]
 
-    balance_before = w.get_account_hbar_balance(str(recipient))
+    balance_before = await w.aget_account_hbar_balance(str(recipient))
     amount = 0.05
 
     tool = TransferHbarTool(context)
@@ -166,11 +142,10 @@ async def test_transfer_without_memo(setup_accounts):
     )
     await tool.execute(executor_client, context, params)
 
-    balance_after = w.get_account_hbar_balance(str(recipient))
+    balance_after = await w.aget_account_hbar_balance(str(recipient))
     assert balance_after - balance_before == to_tinybars(Decimal(amount))
 
 
-@pytest.mark.asyncio
 async def test_invalid_transfer_zero_amount(setup_accounts):
     executor_client = setup_accounts["executor_client"]
     recipient = setup_accounts["recipient_account_id"]
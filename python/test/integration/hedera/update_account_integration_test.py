@@ -23,21 +23,18 @@ from hedera_agent_kit_py.shared.parameter_schemas import (
     SchedulingParams,
 )
 from test import HederaOperationsWrapper
-from test.utils.setup import get_operator_client_for_tests, get_custom_client
+from test.utils.setup import get_custom_client
 
 
 @pytest.fixture(scope="module")
-async def setup_operator():
-    """Create an operator client and wrapper for account update tests."""
-    operator_client = get_operator_client_for_tests()
-    operator_wrapper = HederaOperationsWrapper(operator_client)
-    yield {"operator_client": operator_client, "operator_wrapper": operator_wrapper}
-    operator_client.close()
+def setup_operator(operator_client, operator_wrapper):
+    """Expose the shared operator client and wrapper to the account update tests."""
+    return {"operator_client": operator_client, "operator_wrapper": operator_wrapper}
 
 
-@pytest.fixture
-async def setup_executor(setup_operator):
-    """Create an executor account for each test."""
+@pytest.fixture(scope="module")
+async def setup_executor(setup_operator, mirrornode_service):
+    """Create the executor account shared by the tests in this module."""
     operator_client: Client = setup_operator["operator_client"]
     operator_wrapper: HederaOperationsWrapper = setup_operator["operator_wrapper"]
 
@@ -49,7 +46,7 @@ async def setup_executor(setup_operator):
     )
     executor_account_id = executor_resp.account_id
     executor_client = get_custom_client(executor_account_id, executor_key)
-    executor_wrapper = HederaOperationsWrapper(executor_client)
+    executor_wrapper = HederaOperationsWrapper(executor_client, mirrornode_service)
     context = Context(mode=AgentMode.AUTONOMOUS, account_id=str(executor_account_id))
 
     yield {
@@ -69,7 +66,6 @@ async def setup_executor(setup_operator):
     executor_client.close()
 
 
-@pytest.mark.asyncio
 async def test_update_account_memo_and_token_associations(setup_executor):
     """Test updating memo and max automatic token associations."""
     executor_client: Client = setup_executor["executor_client"]
@@ -96,7 +92,6 @@ async def test_update_account_memo_and_token_associations(setup_executor):
     # assert info.max_automatic_token_associations == 4  # FIXME: not supported by the SDK - implemented for future use
 
 
-@pytest.mark.asyncio
 async def test_update_account_decline_staking_reward(setup_executor):
     """Test updating declineStakingReward flag."""
     executor_client: Client = setup_executor["executor_client"]
@@ -119,7 +114,6 @@ async def test_update_account_decline_staking_reward(setup_executor):
     # assert info.staking_info.decline_staking_reward is True  # FIXME: not supported by the SDK - implemented for future use
 
 
-@pytest.mark.asyncio
 async def test_update_account_invalid_account_id(setup_executor):
     """Test that invalid account ID results in a failure message."""
     executor_client: Client = setup_executor["executor_client"]
@@ -136,7 +130,6 @@ async def test_update_account_invalid_account_id(setup_executor):
     assert result.error is not None
 
 
-@pytest.mark.asyncio
 async def test_scheduled_account_update(setup_executor):
     """Test successful creation of a scheduled account update transaction."""
     executor_client: Client = setup_executor["executor_client"]
@@ -0,0 +1,54 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from hedera_agent_kit_py.shared.models import ToolResponse
+from test.utils import create_langchain_test_setup
+
+MOCKED_RESPONSE = ToolResponse(human_message="mocked response")
+
+
+# ============================================================================
+# SESSION-LEVEL FIXTURES
+# ============================================================================
+
+
+@pytest.fixture(scope="session")
+async def test_setup():
+    """Set up the LangChain agent and toolkit shared by all tool-matching tests.
+
+    Tests mock ``hedera_api.run`` per test (via ``monkeypatch``) and run on their own
+    conversation thread (``langchain_config``), so one agent serves every module.
+    """
+    setup = await create_langchain_test_setup()
+    yield setup
+    setup.cleanup()
+
+
+@pytest.fixture(scope="session")
+async def agent_executor(test_setup):
+    """Provide the LangChain agent executor."""
+    return test_setup.agent
+
+
+@pytest.fixture(scope="session")
+async def toolkit(test_setup):
+    """Provide the LangChain toolkit."""
+    return test_setup.toolkit
+
+
+# ============================================================================
+# FUNCTION-LEVEL FIXTURES
+# ============================================================================
+
+
+@pytest.fixture
+def mock_run(toolkit, monkeypatch) -> AsyncMock:
+    """Replace the toolkit's Hedera API ``run`` with a mock for a single test.
+
+    Tests assert on the tool name and parameters the agent called it with; set
+    ``mock_run.return_value`` to feed the agent a specific tool response.
+    """
+    mock = AsyncMock(return_value=MOCKED_RESPONSE)
+    monkeypatch.setattr(toolkit.get_hedera_agentkit_api(), "run", mock)
+    return mock
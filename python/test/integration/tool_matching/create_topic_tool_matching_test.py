@@ -3,53 +3,20 @@ This module tests whether the LLM correctly extracts parameters and matches
 the correct tool when given various natural language inputs.
 """
 
-from unittest.mock import AsyncMock
-
 import pytest
-from langchain_core.runnables import RunnableConfig
 
-from hedera_agent_kit_py.shared.models import ToolResponse
-from test.utils import create_langchain_test_setup
 
 CREATE_TOPIC_TOOL = "create_topic_tool"
 
 
-@pytest.fixture(scope="module")
-async def test_setup():
-    """Setup before all tests."""
-    setup = await create_langchain_test_setup()
-    yield setup
-    setup.cleanup()
-
-
-@pytest.fixture
-async def agent_executor(test_setup):
-    """Provide the agent executor."""
-    return test_setup.agent
-
-
-@pytest.fixture
-async def toolkit(test_setup):
-    """Provide the toolkit."""
-    return test_setup.toolkit
-
-
-@pytest.mark.asyncio
 async def test_match_create_topic_tool_with_default_params(
-    agent_executor, toolkit, monkeypatch
+    agent_executor, mock_run, langchain_config
 ):
     """Test that the create topic tool matches with default parameters."""
     input_text = "Create a new topic"
-    config: RunnableConfig = {"configurable": {"thread_id": "1"}}
-
-    hedera_api = toolkit.get_hedera_agentkit_api()
-    mock_run = AsyncMock(
-        return_value=ToolResponse(human_message="mocked topic response")
-    )
-    monkeypatch.setattr(hedera_api, "run", mock_run)
 
     await agent_executor.ainvoke(
-        {"messages": [{"role": "user", "content": input_text}]}, config=config
+        {"messages": [{"role": "user", "content": input_text}]}, config=langchain_config
     )
 
     mock_run.assert_awaited_once()
@@ -59,22 +26,14 @@ async def test_match_create_topic_tool_with_default_params(
     assert isinstance(payload, dict)
 
 
-@pytest.mark.asyncio
 async def test_match_create_topic_with_memo_and_submit_key(
-    agent_executor, toolkit, monkeypatch
+    agent_executor, mock_run, langchain_config
 ):
     """Test tool matching when memo and submit key parameters are provided."""
     input_text = 'Create a topic with memo "Payments" and set submit key'
-    config: RunnableConfig = {"configurable": {"thread_id": "1"}}
-
-    hedera_api = toolkit.get_hedera_agentkit_api()
-    mock_run = AsyncMock(
-        return_value=ToolResponse(human_message="mocked topic response")
-    )
-    monkeypatch.setattr(hedera_api, "run", mock_run)
 
     await agent_executor.ainvoke(
-        {"messages": [{"role": "user", "content": input_text}]}, config=config
+        {"messages": [{"role": "user", "content": input_text}]}, config=langchain_config
     )
 
     mock_run.assert_awaited_once()
@@ -85,7 +44,6 @@ async def test_match_create_topic_with_memo_and_submit_key(
     assert payload.get("is_submit_key") is True
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "input_text,expected",
     [
@@ -99,19 +57,12 @@ async def test_match_create_topic_with_memo_and_submit_key(
     ],
 )
 async def test_handle_various_natural_language_variations(
-    agent_executor, toolkit, monkeypatch, input_text, expected
+    agent_executor, mock_run, input_text, expected, langchain_config
 ):
     """Test various natural language expressions for create topic tool."""
-    config: RunnableConfig = {"configurable": {"thread_id": "1"}}
-
-    hedera_api = toolkit.get_hedera_agentkit_api()
-    mock_run = AsyncMock(
-        return_value=ToolResponse(human_message="mocked topic response")
-    )
-    monkeypatch.setattr(hedera_api, "run", mock_run)
 
     await agent_executor.ainvoke(
-        {"messages": [{"role": "user", "content": input_text}]}, config=config
+        {"messages": [{"role": "user", "content": input_text}]}, config=langchain_config
     )
 
     mock_run.assert_awaited_once()
@@ -122,7 +73,6 @@ async def test_handle_various_natural_language_variations(
         assert payload.get(key) == value
 
 
-@pytest.mark.asyncio
 async def test_tool_available(toolkit):
     """Test that create topic tool is available in the toolkit."""
     tools = toolkit.get_tools()
@@ -3,54 +3,21 @@ This module tests whether the LLM correctly extracts parameters and matches
 the correct tool when given various natural language inputs.
 """
 
-from unittest.mock import AsyncMock
-
 import pytest
-from langchain_core.runnables import RunnableConfig
 
 from hedera_agent_kit_py.plugins import core_account_plugin_tool_names
-from hedera_agent_kit_py.shared.models import ToolResponse
-from test.utils import create_langchain_test_setup
 
 DELETE_ACCOUNT_TOOL = core_account_plugin_tool_names["DELETE_ACCOUNT_TOOL"]
 
 
-@pytest.fixture(scope="module")
-async def test_setup():
-    """Setup before all tests."""
-    setup = await create_langchain_test_setup()
-    yield setup
-    setup.cleanup()
-
-
-@pytest.fixture
-async def agent_executor(test_setup):
-    """Provide the agent executor."""
-    return test_setup.agent
-
-
-@pytest.fixture
-async def toolkit(test_setup):
-    """Provide the toolkit."""
-    return test_setup.toolkit
-
-
-@pytest.mark.asyncio
 async def test_match_delete_account_tool_with_account_id_only(
-    agent_executor, toolkit, monkeypatch
+    agent_executor, mock_run, langchain_config
 ):
     """Test that the delete account tool matches when only accountId is provided."""
     input_text = "Delete account 0.0.12345"
-    config: RunnableConfig = {"configurable": {"thread_id": "1"}}
-
-    hedera_api = toolkit.get_hedera_agentkit_api()
-    mock_run = AsyncMock(
-        return_value=ToolResponse(human_message="mocked delete response")
-    )
-    monkeypatch.setattr(hedera_api, "run", mock_run)
 
     await agent_executor.ainvoke(
-        {"messages": [{"role": "user", "content": input_text}]}, config=config
+        {"messages": [{"role": "user", "content": input_text}]}, config=langchain_config
     )
 
     mock_run.assert_awaited_once()
@@ -60,22 +27,14 @@ async def test_match_delete_account_tool_with_account_id_only(
     assert payload.get("account_id") == "0.0.12345"
 
 
-@pytest.mark.asyncio
 async def test_match_delete_account_tool_with_transfer_account_id(
-    agent_executor, toolkit, monkeypatch
+    agent_executor, mock_run, langchain_config
 ):
     """Test that delete account tool matches with transferAccountId parameter."""
     input_text = "Delete the account 0.0.1111 and transfer funds to 0.0.2222"
-    config: RunnableConfig = {"configurable": {"thread_id": "1"}}
-
-    hedera_api = toolkit.get_hedera_agentkit_api()
-    mock_run = AsyncMock(
-        return_value=ToolResponse(human_message="mocked delete response")
-    )
-    monkeypatch.setattr(hedera_api, "run", mock_run)
 
     await agent_executor.ainvoke(
-        {"messages": [{"role": "user", "content": input_text}]}, config=config
+        {"messages": [{"role": "user", "content": input_text}]}, config=langchain_config
     )
 
     mock_run.assert_awaited_once()
@@ -86,7 +45,6 @@ async def test_match_delete_account_tool_with_transfer_account_id(
     assert payload.get("transfer_account_id") == "0.0.2222"
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "input_text,expected",
     [
@@ -98,19 +56,12 @@ async def test_match_delete_account_tool_with_transfer_account_id(
     ],
 )
 async def test_handle_various_natural_language_variations(
-    agent_executor, toolkit, monkeypatch, input_text, expected
+    agent_executor, mock_run, input_text, expected, langchain_config
 ):
     """Test various natural language expressions for delete account tool."""
-    config: RunnableConfig = {"configurable": {"thread_id": "1"}}
-
-    hedera_api = toolkit.get_hedera_agentkit_api()
-    mock_run = AsyncMock(
-        return_value=ToolResponse(human_message="mocked delete response")
-    )
-    monkeypatch.setattr(hedera_api, "run", mock_run)
 
     await agent_executor.ainvoke(
-        {"messages": [{"role": "user", "content": input_text}]}, config=config
+        {"messages": [{"role": "user", "content": input_text}]}, config=langchain_config
     )
 
     mock_run.assert_awaited_once()
@@ -121,7 +72,6 @@ async def test_handle_various_natural_language_variations(
         assert payload.get(key) == value
 
 
-@pytest.mark.asyncio
 async def test_tool_available(toolkit):
     """Test that delete account tool is available in the toolkit."""
     tools = toolkit.get_tools()
@@ -3,50 +3,17 @@ This module tests whether the LLM correctly extracts parameters and matches
 the correct tool when given various natural language inputs.
 """
 
-from unittest.mock import AsyncMock
-import pytest
-from langchain_core.runnables import RunnableConfig
-
-from hedera_agent_kit_py.shared.models import ToolResponse
-from test.utils import create_langchain_test_setup
-
 GET_ACCOUNT_QUERY_TOOL = "get_account_query_tool"
 
 
-@pytest.fixture(scope="module")
-async def test_setup():
-    """Setup the LangChain test environment once per test module."""
-    setup = await create_langchain_test_setup()
-    yield setup
-    setup.cleanup()
-
-
-@pytest.fixture
-async def agent_executor(test_setup):
-    """Provide the agent executor for invoking language queries."""
-    return test_setup.agent
-
-
-@pytest.fixture
-async def toolkit(test_setup):
-    """Provide the toolkit instance."""
-    return test_setup.toolkit
-
-
-@pytest.mark.asyncio
 async def test_match_get_account_query_simple_request(
-    agent_executor, toolkit, monkeypatch
+    agent_executor, mock_run, langchain_config
 ):
     """Test that the tool matches a simple get account info request with explicit account ID."""
     input_text = "Get account info for 0.0.1234"
-    config: RunnableConfig = {"configurable": {"thread_id": "1"}}
-
-    hedera_api = toolkit.get_hedera_agentkit_api()
-    mock_run = AsyncMock(return_value=ToolResponse(human_message="mocked response"))
-    monkeypatch.setattr(hedera_api, "run", mock_run)
 
     await agent_executor.ainvoke(
-        {"messages": [{"role": "user", "content": input_text}]}, config=config
+        {"messages": [{"role": "user", "content": input_text}]}, config=langchain_config
     )
 
     mock_run.assert_awaited_once()
@@ -56,20 +23,14 @@ async def test_match_get_account_query_simple_request(
     assert payload.get("account_id") == "0.0.1234"
 
 
-@pytest.mark.asyncio
 async def test_match_get_account_query_with_query_keyword(
-    agent_executor, toolkit, monkeypatch
+    agent_executor, mock_run, langchain_config
 ):
     """Test that the tool matches when user says 'query' instead of 'get'."""
     input_text = "Query details of account 0.0.5555"
-    config: RunnableConfig = {"configurable": {"thread_id": "1"}}
-
-    hedera_api = toolkit.get_hedera_agentkit_api()
-    mock_run = AsyncMock(return_value=ToolResponse(human_message="mocked response"))
-    monkeypatch.setattr(hedera_api, "run", mock_run)
 
     await agent_executor.ainvoke(
-        {"messages": [{"role": "user", "content": input_text}]}, config=config
+        {"messages": [{"role": "user", "content": input_text}]}, config=langchain_config
     )
 
     mock_run.assert_awaited_once()
@@ -79,9 +40,8 @@ async def test_match_get_account_query_with_query_keyword(
     assert payload.get("account_id") == "0.0.5555"
 
 
-@pytest.mark.asyncio
 async def test_handle_various_natural_language_variations(
-    agent_executor, toolkit, monkeypatch
+    agent_executor, mock_run, langchain_config
 ):
     """Test that the tool matches for various natural language phrasings."""
     variations = [
@@ -89,16 +49,13 @@ async def test_handle_various_natural_language_variations(
         ("Look up account 0.0.3333", "0.0.3333"),
         ("Tell me about 0.0.4444", "0.0.4444"),
     ]
-    config: RunnableConfig = {"configurable": {"thread_id": "1"}}
-
-    hedera_api = toolkit.get_hedera_agentkit_api()
 
     for input_text, expected_account_id in variations:
-        mock_run = AsyncMock(return_value=ToolResponse(human_message="mocked response"))
-        monkeypatch.setattr(hedera_api, "run", mock_run)
+        mock_run.reset_mock()
 
         await agent_executor.ainvoke(
-            {"messages": [{"role": "user", "content": input_text}]}, config=config
+            {"messages": [{"role": "user", "content": input_text}]},
+            config=langchain_config,
         )
 
         mock_run.assert_awaited_once()
@@ -108,7 +65,6 @@ async def test_handle_various_natural_language_variations(
         assert payload.get("account_id") == expected_account_id
 
 
-@pytest.mark.asyncio
 async def test_tool_available(toolkit):
     """Ensure the get account query tool is available in the toolkit."""
     tools = toolkit.get_tools()
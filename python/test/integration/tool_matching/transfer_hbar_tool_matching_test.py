@@ -1,49 +1,20 @@
-from unittest.mock import AsyncMock
-
 import pytest
-from langchain_core.runnables import RunnableConfig
 
 from hedera_agent_kit_py.plugins.core_account_plugin import (
     core_account_plugin_tool_names,
 )
-from hedera_agent_kit_py.shared.models import ToolResponse
-from test.utils import create_langchain_test_setup
 
 TRANSFER_HBAR_TOOL = core_account_plugin_tool_names["TRANSFER_HBAR_TOOL"]
 
 
-@pytest.fixture(scope="module")
-async def test_setup():
-    # Setup before all tests
-    setup = await create_langchain_test_setup()
-    yield setup
-    # Cleanup after all tests
-    setup.cleanup()
-
-
-@pytest.fixture
-async def agent_executor(test_setup):
-    return test_setup.agent
-
-
-@pytest.fixture
-async def toolkit(test_setup):
-    return test_setup.toolkit
-
-
-@pytest.mark.asyncio
-async def test_simple_transfer(agent_executor, toolkit, monkeypatch):
+async def test_simple_transfer(agent_executor, mock_run, langchain_config):
     input_text = "Transfer 23 HBARs to 0.0.1"
-    config: RunnableConfig = {"configurable": {"thread_id": "1"}}
 
     # Mock the underlying Hedera API run method
-    hedera_api = toolkit.get_hedera_agentkit_api()
-    mock_run = AsyncMock(return_value=ToolResponse(human_message="mocked response"))
-    monkeypatch.setattr(hedera_api, "run", mock_run)
 
     # Invoke agent
     await agent_executor.ainvoke(
-        {"messages": [{"role": "user", "content": input_text}]}, config=config
+        {"messages": [{"role": "user", "content": input_text}]}, config=langchain_config
     )
 
     # Assert call
@@ -54,17 +25,11 @@ async def test_simple_transfer(agent_executor, toolkit, monkeypatch):
     assert any(t.account_id == "0.0.1" and t.amount == 23 for t in transfers)
 
 
-@pytest.mark.asyncio
-async def test_transfer_with_memo(agent_executor, toolkit, monkeypatch):
+async def test_transfer_with_memo(agent_executor, mock_run, langchain_config):
     input_text = 'Transfer 2 HBAR to 0.0.3333 with memo "Payment for services"'
-    config: RunnableConfig = {"configurable": {"thread_id": "1"}}
-
-    hedera_api = toolkit.get_hedera_agentkit_api()
-    mock_run = AsyncMock(return_value=ToolResponse(human_message="mocked response"))
-    monkeypatch.setattr(hedera_api, "run", mock_run)
 
     await agent_executor.ainvoke(
-        {"messages": [{"role": "user", "content": input_text}]}, config=config
+        {"messages": [{"role": "user", "content": input_text}]}, config=langchain_config
     )
 
     mock_run.assert_awaited_once()
@@ -76,19 +41,13 @@ async def test_transfer_with_memo(agent_executor, toolkit, monkeypatch):
     assert payload["transaction_memo"] == "Payment for services"
 
 
-@pytest.mark.asyncio
-async def test_incorrect_params(agent_executor, toolkit, monkeypatch):
+async def test_incorrect_params(agent_executor, mock_run, langchain_config):
     # should match the tool anyway
     # the validation is performed on a tool level - not LLM level
     input_text = 'Transfer 1 HBAR to 0.0.0 with memo "Payment for services"'
-    config: RunnableConfig = {"configurable": {"thread_id": "1"}}
-
-    hedera_api = toolkit.get_hedera_agentkit_api()
-    mock_run = AsyncMock(return_value=ToolResponse(human_message="mocked response"))
-    monkeypatch.setattr(hedera_api, "run", mock_run)
 
     await agent_executor.ainvoke(
-        {"messages": [{"role": "user", "content": input_text}]}, config=config
+        {"messages": [{"role": "user", "content": input_text}]}, config=langchain_config
     )
 
     mock_run.assert_awaited_once()
@@ -100,7 +59,6 @@ async def test_incorrect_params(agent_executor, toolkit, monkeypatch):
     assert payload["transaction_memo"] == "Payment for services"
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "input_text, account_id, amount",
     [
@@ -111,16 +69,11 @@ async def test_incorrect_params(agent_executor, toolkit, monkeypatch):
     ],
 )
 async def test_natural_language_variations(
-    agent_executor, toolkit, monkeypatch, input_text, account_id, amount
+    agent_executor, mock_run, input_text, account_id, amount, langchain_config
 ):
-    config: RunnableConfig = {"configurable": {"thread_id": "1"}}
-
-    hedera_api = toolkit.get_hedera_agentkit_api()
-    mock_run = AsyncMock(return_value=ToolResponse(human_message="mocked response"))
-    monkeypatch.setattr(hedera_api, "run", mock_run)
 
     await agent_executor.ainvoke(
-        {"messages": [{"role": "user", "content": input_text}]}, config=config
+        {"messages": [{"role": "user", "content": input_text}]}, config=langchain_config
     )
 
     mock_run.assert_awaited_once()
@@ -38,7 +38,6 @@ def make_params(
     )
 
 
-@pytest.mark.asyncio
 async def test_uses_param_public_key_if_provided():
     """Test that params.public_key is used when provided."""
     mock_context = Context()
@@ -59,7 +58,6 @@ async def test_uses_param_public_key_if_provided():
     assert result.scheduling_params is None
 
 
-@pytest.mark.asyncio
 async def test_uses_operator_public_key_if_no_param():
     """Test that client.operator_public_key is used when no param.public_key."""
     mock_context = Context()
@@ -79,7 +77,6 @@ async def test_uses_operator_public_key_if_no_param():
     assert result.scheduling_params is None
 
 
-@pytest.mark.asyncio
 @patch.object(AccountResolver, "get_default_account")
 async def test_falls_back_to_mirrornode_when_no_operator_key(mock_get_default_account):
     """Test fallback to mirrornode.get_account when no param and no operator key."""
@@ -106,7 +103,6 @@ async def test_falls_back_to_mirrornode_when_no_operator_key(mock_get_default_ac
     mock_mirrornode.get_account.assert_called_once_with("0.0.2002")
 
 
-@pytest.mark.asyncio
 @patch.object(AccountResolver, "get_default_account")
 async def test_throws_error_when_no_public_key_available(mock_get_default_account):
     """Test that error is thrown when no public key is available anywhere."""
@@ -126,7 +122,6 @@ async def test_throws_error_when_no_public_key_available(mock_get_default_accoun
         )
 
 
-@pytest.mark.asyncio
 async def test_applies_defaults_when_values_not_provided():
     """Test that defaults are applied when values are not provided."""
     mock_context = Context()
@@ -147,7 +142,6 @@ async def test_applies_defaults_when_values_not_provided():
     assert result.scheduling_params is None
 
 
-@pytest.mark.asyncio
 async def test_calls_normalise_scheduled_transaction_params_when_scheduled():
     """Test that normalise_scheduled_transaction_params is called when is_scheduled=True."""
     mock_context = Context()
@@ -181,7 +175,6 @@ async def test_calls_normalise_scheduled_transaction_params_when_scheduled():
         assert result.key.to_string_der() == secondary_key.to_string_der()
 
 
-@pytest.mark.asyncio
 async def test_does_not_call_scheduled_params_when_not_scheduled():
     """Test that scheduling params are not processed when is_scheduled=False."""
     mock_context = Context()
@@ -208,7 +201,6 @@ async def test_does_not_call_scheduled_params_when_not_scheduled():
         assert result.scheduling_params is None
 
 
-@pytest.mark.asyncio
 async def test_handles_memo_correctly():
     """Test that memo is correctly handled."""
     mock_context = Context()
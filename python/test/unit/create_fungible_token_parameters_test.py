@@ -0,0 +1,68 @@
+import pytest
+
+from hedera_agent_kit_py.shared.hedera_utils.hedera_parameter_normalizer import (
+    HederaParameterNormaliser,
+)
+from hedera_agent_kit_py.shared.parameter_schemas.token_schema import (
+    CreateFungibleTokenParameters,
+)
+
+
+@pytest.mark.parametrize(
+    "initial_supply, max_supply",
+    [(10, 5), (1_000_001, 1_000_000), (1, 0)],
+)
+def test_rejects_initial_supply_above_max_supply(initial_supply, max_supply):
+    """Should reject an initial supply larger than the max supply before any network call."""
+    with pytest.raises(ValueError) as exc:
+        HederaParameterNormaliser.parse_params_with_schema(
+            {
+                "token_name": "Test Token",
+                "token_symbol": "TST",
+                "initial_supply": initial_supply,
+                "max_supply": max_supply,
+            },
+            CreateFungibleTokenParameters,
+        )
+
+    assert (
+        f"Initial supply ({initial_supply}) cannot exceed max supply ({max_supply})"
+        in str(exc.value)
+    )
+
+
+@pytest.mark.parametrize(
+    "initial_supply, max_supply",
+    [(5, 10), (10, 10), (10, None)],
+)
+def test_accepts_initial_supply_within_max_supply(initial_supply, max_supply):
+    """Should accept an initial supply up to the max supply, or any supply without a cap."""
+    result = HederaParameterNormaliser.parse_params_with_schema(
+        {
+            "token_name": "Test Token",
+            "token_symbol": "TST",
+            "initial_supply": initial_supply,
+            "max_supply": max_supply,
+        },
+        CreateFungibleTokenParameters,
+    )
+
+    assert result.initial_supply == initial_supply
+    assert result.max_supply == max_supply
+
+
+def test_ignores_max_supply_for_infinite_supply_tokens():
+    """Should not compare against max supply when the supply type is infinite."""
+    result = HederaParameterNormaliser.parse_params_with_schema(
+        {
+            "token_name": "Test Token",
+            "token_symbol": "TST",
+            "initial_supply": 1_000_001,
+            "supply_type": 0,
+            "max_supply": 1_000_000,
+        },
+        CreateFungibleTokenParameters,
+    )
+
+    assert result.initial_supply == 1_000_001
+    assert result.supply_type == 0
@@ -13,7 +13,6 @@ from hedera_agent_kit_py.shared.parameter_schemas import (
 )
 
 
-@pytest.mark.asyncio
 async def test_applies_defaults_when_values_not_provided():
     """Should apply defaults when no values are provided (no submit key)."""
     mock_context = Context(account_id="0.0.1001")
@@ -44,7 +43,6 @@ async def test_applies_defaults_when_values_not_provided():
         assert result.memo is None
 
 
-@pytest.mark.asyncio
 async def test_sets_submit_key_from_mirror_node():
     """Should set submit_key using public key from mirror node when is_submit_key is True."""
     mock_context = Context(account_id="0.0.1001")
@@ -81,7 +79,6 @@ async def test_sets_submit_key_from_mirror_node():
         assert result.memo == "hello"
 
 
-@pytest.mark.asyncio
 async def test_falls_back_to_client_operator_key_when_mirror_has_no_key():
     """Should use client.operator_private_key.public_key() if mirror node returns no key."""
     mock_context = Context(account_id="0.0.1001")
@@ -120,7 +117,6 @@ async def test_falls_back_to_client_operator_key_when_mirror_has_no_key():
         )
 
 
-@pytest.mark.asyncio
 async def test_raises_when_no_public_key_for_submit_key():
     """Should raise ValueError when is_submit_key=True and no public key can be determined."""
     mock_context = Context(account_id="0.0.1001")
@@ -153,7 +149,6 @@ async def test_raises_when_no_public_key_for_submit_key():
             )
 
 
-@pytest.mark.asyncio
 async def test_raises_when_no_default_account_id():
     """Should raise ValueError when AccountResolver.get_default_account returns None."""
     mock_context = Context()
@@ -9,15 +9,15 @@ from hedera_agent_kit_py.shared.parameter_schemas import DeleteAccountParameters
 from hedera_agent_kit_py.shared.configuration import Context
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_context():
-    """Provide a mock Context with an account_id."""
+    """Provide a mock Context with an account_id, shared by the module's tests."""
     return Context(account_id="0.0.5005")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_client():
-    """Provide a mock Client instance."""
+    """Provide a mock Client instance, shared by the module's tests (none mutate it)."""
     return MagicMock(spec=Client)
 
 
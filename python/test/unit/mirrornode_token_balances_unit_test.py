@@ -0,0 +1,93 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from hedera_agent_kit_py.shared.hedera_utils.mirrornode import (
+    hedera_mirrornode_service_default_impl as impl_module,
+)
+from hedera_agent_kit_py.shared.hedera_utils.mirrornode.hedera_mirrornode_service_default_impl import (
+    HederaMirrornodeServiceDefaultImpl,
+)
+from hedera_agent_kit_py.shared.utils.ledger_id import LedgerId
+
+SYMBOLS = {"0.0.1001": "AAA", "0.0.1002": "BBB"}
+
+
+def make_service(token_ids):
+    """Build a service whose mirror node lists the given tokens and knows SYMBOLS."""
+    service = HederaMirrornodeServiceDefaultImpl(LedgerId.TESTNET)
+
+    async def fetch_json(url, context=None):
+        if "/tokens/" in url and "/accounts/" not in url:
+            token_id = url.rsplit("/", 1)[-1]
+            if token_id not in SYMBOLS:
+                raise RuntimeError("Failed to fetch token info: HTTP 404")
+            return {"token_id": token_id, "symbol": SYMBOLS[token_id]}
+        return {"tokens": [{"token_id": tid, "balance": 1} for tid in token_ids]}
+
+    service._fetch_json = AsyncMock(side_effect=fetch_json)
+    return service
+
+
+def token_info_urls(service):
+    return [
+        call.args[0]
+        for call in service._fetch_json.call_args_list
+        if "/accounts/" not in call.args[0]
+    ]
+
+
+async def test_fetches_each_repeated_token_once():
+    """Should fetch the symbol of a token listed several times only once."""
+    service = make_service(["0.0.1001", "0.0.1002", "0.0.1001"])
+
+    result = await service.get_account_token_balances("0.0.5005")
+
+    assert [t["symbol"] for t in result["tokens"]] == ["AAA", "BBB", "AAA"]
+    assert len(token_info_urls(service)) == 2
+
+
+async def test_reuses_cached_symbols_across_calls():
+    """Should serve symbols from the cache on later balance listings."""
+    service = make_service(["0.0.1001", "0.0.1002"])
+
+    await service.get_account_token_balances("0.0.5005")
+    result = await service.get_account_token_balances("0.0.5005")
+
+    assert [t["symbol"] for t in result["tokens"]] == ["AAA", "BBB"]
+    assert len(token_info_urls(service)) == 2
+
+
+async def test_falls_back_to_unknown_and_retries_failed_lookups():
+    """Should report UNKNOWN for failed lookups without caching the failure."""
+    service = make_service(["0.0.1001", "0.0.9999"])
+
+    first = await service.get_account_token_balances("0.0.5005")
+    second = await service.get_account_token_balances("0.0.5005")
+
+    assert [t["symbol"] for t in first["tokens"]] == ["AAA", "UNKNOWN"]
+    assert [t["symbol"] for t in second["tokens"]] == ["AAA", "UNKNOWN"]
+    assert token_info_urls(service).count(f"{service.base_url}/tokens/0.0.9999") == 2
+
+
+async def test_refetches_expired_symbols(monkeypatch):
+    """Should fetch a symbol again once its cache entry has expired."""
+    monkeypatch.setattr(impl_module, "TOKEN_SYMBOL_CACHE_TTL_SECONDS", 0.0)
+    service = make_service(["0.0.1001"])
+
+    await service.get_account_token_balances("0.0.5005")
+    await service.get_account_token_balances("0.0.5005")
+
+    assert len(token_info_urls(service)) == 2
+
+
+@pytest.mark.parametrize("max_size", [1, 2])
+async def test_bounds_the_number_of_cached_symbols(monkeypatch, max_size):
+    """Should evict the oldest symbols once the cache is full."""
+    monkeypatch.setattr(impl_module, "TOKEN_SYMBOL_CACHE_MAX_SIZE", max_size)
+    service = make_service(["0.0.1001", "0.0.1002"])
+
+    await service.get_account_token_balances("0.0.5005")
+
+    assert len(service._token_symbols) == max_size
+    assert "0.0.1002" in service._token_symbols
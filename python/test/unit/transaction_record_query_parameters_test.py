@@ -0,0 +1,42 @@
+import pytest
+from pydantic import ValidationError
+
+from hedera_agent_kit_py.shared.parameter_schemas import (
+    TransactionRecordQueryParameters,
+)
+
+
+@pytest.mark.parametrize(
+    "transaction_id, expected",
+    [
+        ("0.0.5005-1700000000-123456789", "0.0.5005-1700000000-123456789"),
+        ("0.0.5005@1700000000.123456789", "0.0.5005@1700000000.123456789"),
+        ("  0.0.5005-1700000000-123456789\n", "0.0.5005-1700000000-123456789"),
+    ],
+)
+def test_accepts_valid_transaction_ids(transaction_id, expected):
+    """Should accept mirror-node and SDK-style IDs, stripping surrounding whitespace."""
+    params = TransactionRecordQueryParameters(transaction_id=transaction_id)
+
+    assert params.transaction_id == expected
+
+
+@pytest.mark.parametrize(
+    "transaction_id",
+    [
+        "",
+        "   ",
+        "?scheduled",
+        "0.0.5005@1700000000.123456789?scheduled",
+        "0.0.5005-1700000000-abc",
+        "0.0.5005-1700000000-1/../accounts",
+        "0.0.5005 1700000000 1",
+        "0.0.5005-1700000000-1?nonce=1",
+    ],
+)
+def test_rejects_invalid_transaction_ids(transaction_id):
+    """Should reject IDs with characters a transaction ID cannot contain."""
+    with pytest.raises(ValidationError) as exc:
+        TransactionRecordQueryParameters(transaction_id=transaction_id)
+
+    assert "Transaction ID may only contain" in str(exc.value)
@@ -30,7 +30,6 @@ def make_params(transfers, memo=None, source_account_id="0.0.1001", is_scheduled
     )
 
 
-@pytest.mark.asyncio
 @patch.object(AccountResolver, "resolve_account")
 async def test_single_transfer(mock_resolve):
     mock_context = Context()
@@ -55,7 +54,6 @@ async def test_single_transfer(mock_resolve):
     mock_resolve.assert_called_once_with(source_account_id, mock_context, mock_client)
 
 
-@pytest.mark.asyncio
 @patch.object(AccountResolver, "resolve_account")
 async def test_multiple_transfers(mock_resolve):
     mock_context = Context()
@@ -84,7 +82,6 @@ async def test_multiple_transfers(mock_resolve):
     assert source_amt == -total
 
 
-@pytest.mark.asyncio
 @patch.object(AccountResolver, "resolve_account")
 async def test_fractional_and_small_amount(mock_resolve):
     mock_context = Context()
@@ -105,7 +102,6 @@ async def test_fractional_and_small_amount(mock_resolve):
     assert source_transfer == -1
 
 
-@pytest.mark.asyncio
 @patch.object(AccountResolver, "resolve_account")
 async def test_invalid_transfer_amounts(mock_resolve):
     mock_context = Context()
@@ -135,7 +131,6 @@ async def test_invalid_transfer_amounts(mock_resolve):
         )
 
 
-@pytest.mark.asyncio
 @patch.object(AccountResolver, "resolve_account")
 async def test_transfer_without_memo(mock_resolve):
     mock_context = Context()
@@ -151,7 +146,6 @@ async def test_transfer_without_memo(mock_resolve):
     assert result.transaction_memo is None
 
 
-@pytest.mark.asyncio
 @patch.object(AccountResolver, "resolve_account")
 async def test_total_transfers_sum_to_zero(mock_resolve):
     mock_context = Context()
@@ -171,3 +165,53 @@ async def test_total_transfers_sum_to_zero(mock_resolve):
 
     total = sum(result.hbar_transfers.values())
     assert total == 0
+
+
+@patch.object(AccountResolver, "resolve_account")
+async def test_repeated_recipient_amounts_are_summed(mock_resolve):
+    mock_context = Context()
+    mock_client = AsyncMock()
+    source_account_id = "0.0.1001"
+    mock_resolve.return_value = source_account_id
+
+    params = make_params(
+        [
+            {"account_id": "0.0.1002", "amount": 1},
+            {"account_id": "0.0.1002", "amount": 2},
+        ]
+    )
+    result = await HederaParameterNormaliser.normalise_transfer_hbar(
+        params, mock_context, mock_client
+    )
+
+    assert len(result.hbar_transfers) == 2
+    assert result.hbar_transfers[AccountId.from_string("0.0.1002")] == to_tinybars(
+        Decimal(3)
+    )
+    assert sum(result.hbar_transfers.values()) == 0
+
+
+@patch.object(AccountResolver, "resolve_account")
+async def test_zero_net_transfers_are_dropped(mock_resolve):
+    mock_context = Context()
+    mock_client = AsyncMock()
+    source_account_id = "0.0.1001"
+    mock_resolve.return_value = source_account_id
+
+    params = make_params([{"account_id": source_account_id, "amount": 5}])
+    result = await HederaParameterNormaliser.normalise_transfer_hbar(
+        params, mock_context, mock_client
+    )
+
+    assert AccountId.from_string(source_account_id) not in result.hbar_transfers
+    assert result.hbar_transfers == {}
+
+
+def test_parse_params_with_schema_returns_already_parsed_instance():
+    params = make_params([{"account_id": "0.0.1002", "amount": 1}])
+
+    parsed = HederaParameterNormaliser.parse_params_with_schema(
+        params, TransferHbarParameters
+    )
+
+    assert parsed is params
@@ -1,4 +1,3 @@
-import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from hiero_sdk_python import AccountId, Client, Network
 from hedera_agent_kit_py.shared.configuration import Context
@@ -12,7 +11,6 @@ from hedera_agent_kit_py.shared.parameter_schemas import (
 )
 
 
-@pytest.mark.asyncio
 async def test_resolves_account_id_and_includes_only_supported_fields():
     """Should resolve account_id via AccountResolver and include only supported fields."""
     mock_context = Context(account_id="0.0.5005")
@@ -46,7 +44,6 @@ async def test_resolves_account_id_and_includes_only_supported_fields():
     )
 
 
-@pytest.mark.asyncio
 async def test_passes_through_account_id_only():
     """Should pass through account_id when provided (unsupported fields ignored)."""
     mock_context = Context(account_id="0.0.5005")
@@ -74,7 +71,6 @@ async def test_passes_through_account_id_only():
     )
 
 
-@pytest.mark.asyncio
 async def test_omits_all_unsupported_fields_when_not_provided():
     """Should omit all unsupported fields when not provided."""
     mock_context = Context(account_id="0.0.5005")
@@ -102,7 +98,6 @@ async def test_omits_all_unsupported_fields_when_not_provided():
     assert not hasattr(result.account_params, "staked_account_id")
 
 
-@pytest.mark.asyncio
 async def test_supports_scheduling_params_when_provided():
     """Should normalize scheduling parameters when provided."""
     mock_context = Context(account_id="0.0.5005")
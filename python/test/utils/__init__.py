@@ -1,10 +1,15 @@
-from .general_utils import from_evm_address, wait
+from .general_utils import account_exists, from_evm_address, wait, wait_for_mirror
 from .hedera_operations_wrapper import HederaOperationsWrapper
+from .agent_helpers import create_test_account, execute_agent_request
 from .setup.langchain_test_setup import create_langchain_test_setup
 
 __all__ = [
+    "account_exists",
     "from_evm_address",
     "HederaOperationsWrapper",
     "create_langchain_test_setup",
+    "create_test_account",
+    "execute_agent_request",
     "wait",
+    "wait_for_mirror",
 ]
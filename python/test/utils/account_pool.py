@@ -0,0 +1,63 @@
+import asyncio
+from typing import List
+
+from hiero_sdk_python import AccountId
+
+from .agent_helpers import create_test_account
+from .hedera_operations_wrapper import HederaOperationsWrapper
+from .teardown import return_hbars_and_delete_account
+
+
+class AccountPool:
+    """
+    Pool of zero-balance test accounts keyed with the wrapper's operator key.
+
+    Accounts are created concurrently up front and handed out to tests, which either
+    release them for reuse (when they only modify account properties) or consume them
+    (e.g. by deleting them). Accounts still in the pool are deleted on close.
+    """
+
+    def __init__(self, wrapper: HederaOperationsWrapper, size: int = 3):
+        self.wrapper = wrapper
+        self.size = size
+        self._available: List[AccountId] = []
+
+    async def _create(self) -> AccountId:
+        resp = await create_test_account(self.wrapper)
+        return resp.account_id
+
+    async def warm(self) -> None:
+        """Creates the initial accounts concurrently."""
+        created = await asyncio.gather(*(self._create() for _ in range(self.size)))
+        self._available.extend(created)
+
+    async def acquire(self) -> AccountId:
+        """
+        Takes an account from the pool, creating a new one if the pool is empty.
+
+        :return: The ID of an account the caller may modify or delete.
+        """
+        if self._available:
+            return self._available.pop()
+        return await self._create()
+
+    def release(self, account_id: AccountId) -> None:
+        """
+        Returns a still-existing account to the pool for reuse.
+
+        :param account_id: ID of an account previously obtained with ``acquire``.
+        """
+        self._available.append(account_id)
+
+    async def close(self) -> None:
+        """Deletes every pooled account, returning leftover HBAR to the operator."""
+        operator_account_id = self.wrapper.client.operator_account_id
+        accounts, self._available = self._available, []
+        await asyncio.gather(
+            *(
+                return_hbars_and_delete_account(
+                    self.wrapper, account_id, operator_account_id
+                )
+                for account_id in accounts
+            )
+        )
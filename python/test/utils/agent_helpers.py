@@ -0,0 +1,72 @@
+"""Helpers shared by tests that drive the LangChain agent end to end."""
+
+from contextlib import aclosing
+from typing import Any, Dict, Optional
+
+from langchain_core.messages import ToolMessage
+from langchain_core.runnables import Runnable, RunnableConfig
+
+from hedera_agent_kit_py.shared.parameter_schemas import (
+    CreateAccountParametersNormalised,
+)
+from hedera_agent_kit_py.shared.strategies.tx_mode_strategy import (
+    RawTransactionResponse,
+)
+from .hedera_operations_wrapper import HederaOperationsWrapper
+
+
+async def execute_agent_request(
+    agent_executor: Runnable,
+    input_text: str,
+    config: RunnableConfig,
+    tool_name: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Sends a single user message to the agent and returns its result.
+
+    When ``tool_name`` is given, the agent run is streamed and stopped as soon as that
+    tool has responded, skipping the final answer the LLM would compose from the tool
+    output. Use it for tests asserting only on the tool response.
+
+    :param agent_executor: The LangChain agent to invoke.
+    :param input_text: Content of the user message.
+    :param config: Runnable config carrying the conversation thread ID.
+    :param tool_name: Name of the tool whose response ends the run early.
+    :return: The agent state containing the exchanged messages.
+    """
+    agent_input = {"messages": [{"role": "user", "content": input_text}]}
+    if tool_name is None:
+        return await agent_executor.ainvoke(agent_input, config=config)
+
+    state: Dict[str, Any] = {}
+    # aclosing shuts the stream down right away on break instead of leaving the
+    # pending graph run to be finalised whenever the generator is collected.
+    async with aclosing(
+        agent_executor.astream(agent_input, config=config, stream_mode="values")
+    ) as stream:
+        async for state in stream:
+            if any(
+                isinstance(message, ToolMessage) and message.name == tool_name
+                for message in state.get("messages", [])
+            ):
+                break
+    return state
+
+
+async def create_test_account(
+    executor_wrapper: HederaOperationsWrapper,
+    initial_balance_in_tinybar: int = 0,
+) -> RawTransactionResponse:
+    """
+    Creates an account keyed with the executor's operator key for a test to act on.
+
+    :param executor_wrapper: Wrapper used to submit the account creation.
+    :param initial_balance_in_tinybar: Initial balance of the new account.
+    :return: The raw transaction response holding the new account ID.
+    """
+    return await executor_wrapper.create_account(
+        CreateAccountParametersNormalised(
+            key=executor_wrapper.operator_public_key,
+            initial_balance=initial_balance_in_tinybar,
+        )
+    )
@@ -1,5 +1,17 @@
+import asyncio
+import inspect
+from typing import Any, Awaitable, Callable, Optional, Union
+
+import async_timeout
+from hiero_sdk_python import AccountId
 from hiero_sdk_python.contract.contract_id import ContractId
 
+from hedera_agent_kit_py.shared.hedera_utils.mirrornode.hedera_mirrornode_service_interface import (
+    IHederaMirrornodeService,
+)
+
+from .setup.langchain_test_config import MIRROR_NODE_WAITING_TIME
+
 
 def from_evm_address(evm_address: str) -> ContractId:
     """
@@ -36,13 +48,75 @@ async def wait(time_in_millis: int):
     """
     Waits for a specified amount of time.
 
-    This function pauses the execution of the program for a given duration
-    specified in milliseconds. It uses Python's built-in time module to achieve
-    this delay.
+    This function pauses the execution of the current coroutine for a given
+    duration specified in milliseconds without blocking the event loop.
 
     :param time_in_millis: The amount of time to wait, specified in milliseconds.
     :type time_in_millis: int
     """
-    import time
+    await asyncio.sleep(time_in_millis / 1000)
+
+
+async def wait_for_mirror(
+    predicate: Callable[[], Union[Any, Awaitable[Any]]],
+    timeout_in_millis: int = MIRROR_NODE_WAITING_TIME * 2,
+    initial_delay_in_millis: int = 200,
+    backoff_factor: float = 1.5,
+    max_delay_in_millis: int = 2000,
+) -> Any:
+    """
+    Polls until the mirror node reflects the expected state.
+
+    Replaces fixed ``wait(MIRROR_NODE_WAITING_TIME)`` sleeps: the predicate is
+    retried with exponential backoff and the call returns as soon as it yields a
+    truthy value. Exceptions raised by the predicate (e.g. HTTP 404 while the
+    record has not been ingested yet) are treated as "not ready", as are async
+    attempts cut off by the deadline.
+
+    :param predicate: Callable (sync or async) checking the mirror node state.
+    :param timeout_in_millis: Overall deadline, specified in milliseconds.
+    :param initial_delay_in_millis: Delay before the first retry, in milliseconds.
+    :param backoff_factor: Multiplier applied to the delay after each attempt.
+    :param max_delay_in_millis: Upper bound for the delay between attempts, in milliseconds.
+    :return: The first truthy value returned by the predicate.
+    :raises TimeoutError: If the predicate does not succeed before the deadline.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout_in_millis / 1000
+    delay = initial_delay_in_millis / 1000
+    last_error: Optional[Exception] = None
+
+    while True:
+        try:
+            result = predicate()
+            if inspect.isawaitable(result):
+                # A hanging request must not push the poll past the overall deadline
+                async with async_timeout.timeout_at(deadline):
+                    result = await result
+            if result:
+                return result
+        except Exception as e:
+            last_error = e
+
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            raise TimeoutError(
+                f"Mirror node did not reach the expected state within {timeout_in_millis} ms"
+            ) from last_error
+
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * backoff_factor, max_delay_in_millis / 1000)
+
+
+async def account_exists(
+    mirrornode: IHederaMirrornodeService, account_id: Union[str, AccountId]
+) -> bool:
+    """
+    Mirror node predicate for ``wait_for_mirror``: checks that an account has been ingested.
 
-    time.sleep(time_in_millis / 1000)
+    :param mirrornode: Mirror node service to query.
+    :param account_id: ID of the account to look up.
+    :return: True once the mirror node returns the account.
+    :raises ValueError: If the mirror node does not know the account yet.
+    """
+    return bool(await mirrornode.get_account(str(account_id)))
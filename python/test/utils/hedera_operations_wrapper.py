@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+import logging
+from functools import cached_property
 from typing import Any, Dict, List, Optional
 
 from hiero_sdk_python import (
@@ -19,6 +22,7 @@ from hiero_sdk_python import (
     TokenInfo,
     TokenNftInfo,
     TransactionReceipt,
+    PublicKey,
 )
 from hiero_sdk_python.account.account_balance import AccountBalance
 from hiero_sdk_python.consensus.topic_info import TopicInfo
@@ -26,8 +30,10 @@ from hiero_sdk_python.contract.contract_create_transaction import (
     ContractCreateTransaction,
 )
 
-from hedera_agent_kit_py.shared.configuration import Context
 from hedera_agent_kit_py.shared.hedera_utils.hedera_builder import HederaBuilder
+from hedera_agent_kit_py.shared.hedera_utils.mirrornode.hedera_mirrornode_service_interface import (
+    IHederaMirrornodeService,
+)
 from hedera_agent_kit_py.shared.hedera_utils.mirrornode.hedera_mirrornode_utils import (
     get_mirrornode_service,
 )
@@ -38,7 +44,6 @@ from hedera_agent_kit_py.shared.hedera_utils.mirrornode.types import (
     TopicMessagesResponse,
     TokenBalancesResponse,
 )
-from hedera_agent_kit_py.shared.models import ExecutedTransactionToolResponse
 from hedera_agent_kit_py.shared.parameter_schemas import (
     AirdropFungibleTokenParametersNormalised,
     TransferHbarParametersNormalised,
@@ -65,10 +70,26 @@ from . import from_evm_address
 class HederaOperationsWrapper:
     """Wrapper around Hedera SDK operations with transaction execution strategies."""
 
-    def __init__(self, client: Client):
+    def __init__(
+        self, client: Client, mirrornode: Optional[IHederaMirrornodeService] = None
+    ):
         self.client = client
-        self.execute_strategy = ExecuteStrategy()
-        self.mirrornode = get_mirrornode_service(None, LedgerId.TESTNET)
+        self.mirrornode = get_mirrornode_service(mirrornode, LedgerId.TESTNET)
+
+    @cached_property
+    def operator_public_key(self) -> PublicKey:
+        """Public key of the client operator, derived once per wrapper."""
+        return self.client.operator_private_key.public_key()
+
+    async def _execute(self, tx: Any) -> RawTransactionResponse:
+        """Execute a transaction and return its raw response.
+
+        ``tx.execute`` blocks until the receipt arrives, so it runs on a worker thread;
+        setups gathering several independent transactions then overlap instead of
+        serializing on the test event loop.
+        """
+        receipt: TransactionReceipt = await asyncio.to_thread(tx.execute, self.client)
+        return ExecuteStrategy.raw_response_from_receipt(receipt)
 
     # ---------------------------
     # ACCOUNT OPERATIONS
@@ -77,19 +98,13 @@ class HederaOperationsWrapper:
         self, params: CreateAccountParametersNormalised
     ) -> RawTransactionResponse:
         tx = HederaBuilder.create_account(params)
-        result: ExecutedTransactionToolResponse = await self.execute_strategy.handle(
-            tx, self.client, Context()
-        )
-        return result.raw
+        return await self._execute(tx)
 
     async def delete_account(
         self, params: DeleteAccountParametersNormalised
     ) -> RawTransactionResponse:
         tx = HederaBuilder.delete_account(params)
-        result: ExecutedTransactionToolResponse = await self.execute_strategy.handle(
-            tx, self.client, Context()
-        )
-        return result.raw
+        return await self._execute(tx)
 
     # ---------------------------
     # TOKEN OPERATIONS
@@ -98,28 +113,19 @@ class HederaOperationsWrapper:
         self, params: CreateFungibleTokenParametersNormalised
     ) -> RawTransactionResponse:
         tx = HederaBuilder.create_fungible_token(params)
-        result: ExecutedTransactionToolResponse = await self.execute_strategy.handle(
-            tx, self.client, Context()
-        )
-        return result.raw
+        return await self._execute(tx)
 
     async def create_non_fungible_token(
         self, params: CreateNonFungibleTokenParametersNormalised
     ) -> RawTransactionResponse:
         tx = HederaBuilder.create_non_fungible_token(params)
-        result: ExecutedTransactionToolResponse = await self.execute_strategy.handle(
-            tx, self.client, Context()
-        )
-        return result.raw
+        return await self._execute(tx)
 
     async def delete_token(
         self, params: DeleteTokenParametersNormalised
     ) -> RawTransactionResponse:
         tx = HederaBuilder.delete_token(params)
-        result: ExecutedTransactionToolResponse = await self.execute_strategy.handle(
-            tx, self.client, Context()
-        )
-        return result.raw
+        return await self._execute(tx)
 
     # ---------------------------
     # TOPIC (CONSENSUS) OPERATIONS
@@ -128,28 +134,19 @@ class HederaOperationsWrapper:
         self, params: CreateTopicParametersNormalised
     ) -> RawTransactionResponse:
         tx = HederaBuilder.create_topic(params)
-        result: ExecutedTransactionToolResponse = await self.execute_strategy.handle(
-            tx, self.client, Context()
-        )
-        return result.raw
+        return await self._execute(tx)
 
     async def delete_topic(
         self, params: DeleteTopicParametersNormalised
     ) -> RawTransactionResponse:
         tx = HederaBuilder.delete_topic(params)
-        result: ExecutedTransactionToolResponse = await self.execute_strategy.handle(
-            tx, self.client, Context()
-        )
-        return result.raw
+        return await self._execute(tx)
 
     async def submit_message(
         self, params: SubmitTopicMessageParametersNormalised
     ) -> RawTransactionResponse:
         tx = HederaBuilder.submit_topic_message(params)
-        result: ExecutedTransactionToolResponse = await self.execute_strategy.handle(
-            tx, self.client, Context()
-        )
-        return result.raw
+        return await self._execute(tx)
 
     async def get_topic_messages(self, topic_id: str) -> TopicMessagesResponse:
         return await self.mirrornode.get_topic_messages(
@@ -168,38 +165,26 @@ class HederaOperationsWrapper:
         self, params: TransferHbarParametersNormalised
     ) -> RawTransactionResponse:
         tx = HederaBuilder.transfer_hbar(params)
-        result: ExecutedTransactionToolResponse = await self.execute_strategy.handle(
-            tx, self.client, Context()
-        )
-        return result.raw
+        return await self._execute(tx)
 
     async def airdrop_token(
         self, params: AirdropFungibleTokenParametersNormalised
     ) -> RawTransactionResponse:
         tx = HederaBuilder.airdrop_fungible_token(params)
-        result: ExecutedTransactionToolResponse = await self.execute_strategy.handle(
-            tx, self.client, Context()
-        )
-        return result.raw
+        return await self._execute(tx)
 
     async def transfer_fungible(
         self, params: TransferFungibleTokenParametersNormalised
     ) -> RawTransactionResponse:
         tx = HederaBuilder.transfer_fungible_token(params)
-        result: ExecutedTransactionToolResponse = await self.execute_strategy.handle(
-            tx, self.client, Context()
-        )
-        return result.raw
+        return await self._execute(tx)
 
     async def associate_token(self, params: Dict[str, str]) -> RawTransactionResponse:
         tx = TokenAssociateTransaction(
             account_id=AccountId.from_string(params["accountId"]),
             token_ids=[TokenId.from_string(params["tokenId"])],
         )
-        result: ExecutedTransactionToolResponse = await self.execute_strategy.handle(
-            tx, self.client, Context()
-        )
-        return result.raw
+        return await self._execute(tx)
 
     # ---------------------------
     # READ-ONLY QUERIES
@@ -226,8 +211,16 @@ class HederaOperationsWrapper:
         query = TokenNftInfoQuery(nft_id=NftId(TokenId.from_string(token_id), serial))
         return query.execute(self.client)
 
-    def get_account_token_balances(self, account_id: str) -> List[Dict[str, Any]]:
-        balances = self.get_account_balances(account_id)
+    def get_account_token_balances(
+        self, account_id: str, balances: Optional[AccountBalance] = None
+    ) -> List[Dict[str, Any]]:
+        """List the token balances of an account.
+
+        Pass ``balances`` from an earlier ``get_account_balances`` call to slice it
+        instead of issuing another balance query.
+        """
+        if balances is None:
+            balances = self.get_account_balances(account_id)
         tokens_map = getattr(balances, "tokens", {}) or {}
         decimals_map = getattr(balances, "token_decimals", {}) or {}
 
@@ -241,9 +234,18 @@ class HederaOperationsWrapper:
         ]
 
     def get_account_token_balance(
-        self, account_id: str, token_id: str
+        self,
+        account_id: str,
+        token_id: str,
+        balances: Optional[AccountBalance] = None,
     ) -> Dict[str, Any]:
-        balances = self.get_account_balances(account_id)
+        """Return the balance of one token held by an account.
+
+        Pass ``balances`` from an earlier ``get_account_balances`` call to slice it
+        instead of issuing another balance query.
+        """
+        if balances is None:
+            balances = self.get_account_balances(account_id)
         token_id_obj = TokenId.from_string(token_id)
         balance = (getattr(balances, "tokens", {}) or {}).get(token_id_obj, 0)
         decimals = (getattr(balances, "token_decimals", {}) or {}).get(token_id_obj, 0)
@@ -256,8 +258,9 @@ class HederaOperationsWrapper:
     async def get_account_token_balance_from_mirrornode(
         self, account_id: str, token_id: str
     ) -> TokenBalance:
+        # Filter on the mirror node so only the requested token is returned
         token_balances: TokenBalancesResponse = (
-            await self.mirrornode.get_account_token_balances(account_id)
+            await self.mirrornode.get_account_token_balances(account_id, token_id)
         )
         found = next(
             (t for t in token_balances.get("tokens") if t.get("token_id") == token_id),
@@ -274,19 +277,26 @@ class HederaOperationsWrapper:
             return int(balance.to_tinybars())
         return int(balance or 0)
 
+    async def aget_account_hbar_balance(self, account_id: str) -> int:
+        # The SDK query is blocking; run it in a worker thread so reads can be gathered
+        return await asyncio.to_thread(self.get_account_hbar_balance, account_id)
+
     # ---------------------------
     # CONTRACTS / EVM
     # ---------------------------
     async def deploy_erc20(self, bytecode: bytes) -> Dict[str, Optional[str]]:
         try:
             tx = ContractCreateTransaction().set_gas(3_000_000).set_bytecode(bytecode)
-            receipt: TransactionReceipt = tx.execute(self.client)
+            # The SDK call is blocking; keep the event loop free while the contract deploys
+            receipt: TransactionReceipt = await asyncio.to_thread(
+                tx.execute, self.client
+            )
             return {
                 "contractId": str(getattr(receipt, "contract_id", None)),
                 "transactionId": str(getattr(receipt, "transaction_id", None)),
             }
         except Exception as exc:
-            print("[HederaOperationsWrapper] Error deploying ERC20:", exc)
+            logging.error("[HederaOperationsWrapper] Error deploying ERC20: %s", exc)
             raise
 
     async def get_contract_info(self, evm_contract_address: str) -> Any:
@@ -295,7 +305,7 @@ class HederaOperationsWrapper:
         query = ContractInfoQuery().set_contract_id(
             from_evm_address(evm_contract_address)
         )
-        return query.execute(self.client)
+        return await asyncio.to_thread(query.execute, self.client)
 
     # ---------------------------
     # AIRDROPS, ALLOWANCES, APPROVALS
@@ -315,31 +325,19 @@ class HederaOperationsWrapper:
 
     async def approve_hbar_allowance(self, params: Any) -> RawTransactionResponse:
         tx = HederaBuilder.approve_hbar_allowance(params)
-        result: ExecutedTransactionToolResponse = await self.execute_strategy.handle(
-            tx, self.client, Context()
-        )
-        return result.raw
+        return await self._execute(tx)
 
     async def approve_token_allowance(self, params: Any) -> RawTransactionResponse:
         tx = HederaBuilder.approve_token_allowance(params)
-        result: ExecutedTransactionToolResponse = await self.execute_strategy.handle(
-            tx, self.client, Context()
-        )
-        return result.raw
+        return await self._execute(tx)
 
     async def approve_nft_allowance(self, params: Any) -> RawTransactionResponse:
         tx = HederaBuilder.approve_nft_allowance(params)
-        result: ExecutedTransactionToolResponse = await self.execute_strategy.handle(
-            tx, self.client, Context()
-        )
-        return result.raw
+        return await self._execute(tx)
 
     async def mint_nft(self, params: Any) -> RawTransactionResponse:
         tx = HederaBuilder.mint_non_fungible_token(params)
-        result: ExecutedTransactionToolResponse = await self.execute_strategy.handle(
-            tx, self.client, Context()
-        )
-        return result.raw
+        return await self._execute(tx)
 
     async def get_account_nfts(self, account_id: str) -> Any:
         return await self.mirrornode.get_account_nfts(account_id)
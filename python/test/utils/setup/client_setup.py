@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 
 from hiero_sdk_python import AccountId, PrivateKey, Client, Network
 from pydantic import BaseModel, Field, ValidationError
@@ -43,6 +44,23 @@ def get_operator_client_for_tests() -> Client:
     return get_custom_client(account_id, private_key)
 
 
+@lru_cache(maxsize=None)
+def get_testnet_network() -> Network:
+    """
+    Returns the testnet network configuration shared by all test clients.
+
+    Building a ``Network`` fetches the address book from the mirror node and each
+    node lazily opens its own gRPC channel. Sharing one instance lets every client
+    in the process (one per test account) reuse those channels instead of paying
+    the setup again. Clients stay cheap and separate, so closing one does not
+    affect the others.
+
+    Returns:
+        hedera.Network: The cached testnet network.
+    """
+    return Network(network="testnet")
+
+
 def get_custom_client(account_id: AccountId, private_key: PrivateKey) -> Client:
     """
     Creates a Hedera testnet client with custom credentials.
@@ -59,7 +77,7 @@ def get_custom_client(account_id: AccountId, private_key: PrivateKey) -> Client:
         >>> tests_private_key = PrivateKey.from_string("302e020100300506032b657004220420...")
         >>> tests_client = get_custom_client(tests_account_id, tests_private_key)
     """
-    client = Client(Network(network="testnet"))
+    client = Client(get_testnet_network())
     client.set_operator(account_id, private_key)
 
     return client
@@ -59,6 +59,8 @@ DEFAULT_LLM_OPTIONS: LLMOptions = LLMOptions(
         When error occurs, respond with a detailed error message.""",
     api_key=None,
     base_url=None,
+    # Every test sends the same system prompt and tool schemas; share their cache
+    prompt_cache_key="hedera-agent-kit-tests",
 )
 
 TOOLKIT_OPTIONS: LangchainTestOptions = LangchainTestOptions(
@@ -1,8 +1,11 @@
 import os
+from pathlib import Path
 from typing import Optional, Any, Callable
 
 from hiero_sdk_python import Client
 from langchain.agents import create_agent
+from langchain_anthropic.middleware import AnthropicPromptCachingMiddleware
+from langchain_core.globals import set_llm_cache
 from langgraph.checkpoint.memory import InMemorySaver
 
 from hedera_agent_kit_py.langchain.toolkit import HederaLangchainToolkit
@@ -14,13 +17,38 @@ from .langchain_test_config import (
     LangchainTestOptions,
     get_provider_api_key_map,
 )
-from .llm_factory import LLMFactory, LLMOptions
+from .llm_cache import SQLiteLLMCache
+from .llm_factory import LLMFactory, LLMOptions, LLMProvider
 
 
 class CompiledGraph:
     pass
 
 
+DEFAULT_LLM_CACHE_PATH = Path(__file__).resolve().parents[2] / ".llm_cache.sqlite"
+
+_llm_cache_configured = False
+
+
+def configure_llm_cache() -> None:
+    """
+    Enables LangChain's LLM response cache for this process when ``E2E_LLM_CACHE=1``.
+
+    Only the model's decisions (which tool to call and with which arguments) are
+    cached, keyed on the full prompt, model parameters and bound tool schemas.
+    Tools are still executed for every request, so on-chain side effects stay live.
+    Responses persist in ``E2E_LLM_CACHE_PATH`` (default ``test/.llm_cache.sqlite``)
+    so re-runs of the suite reuse them; delete the file to reset the cache.
+    """
+    global _llm_cache_configured
+    if _llm_cache_configured or os.getenv("E2E_LLM_CACHE") != "1":
+        return
+
+    database_path = os.getenv("E2E_LLM_CACHE_PATH") or DEFAULT_LLM_CACHE_PATH
+    set_llm_cache(SQLiteLLMCache(database_path))
+    _llm_cache_configured = True
+
+
 class LangchainTestSetup:
     """Container for LangChain test setup components."""
 
@@ -79,6 +107,7 @@ async def create_langchain_test_setup(
     }
 
     # Create the LLM instance
+    configure_llm_cache()
     llm = LLMFactory.create_llm(resolved_llm_options)
 
     # Initialize toolkit
@@ -96,10 +125,16 @@ async def create_langchain_test_setup(
 
     # Prepare tools and create agent
     tools = toolkit.get_tools()
+    # The system prompt and tool schemas form a static prefix shared by every request.
+    # OpenAI caches it automatically; Anthropic needs explicit cache breakpoints.
+    middleware = []
+    if provider == LLMProvider.ANTHROPIC:
+        middleware.append(AnthropicPromptCachingMiddleware())
     agent = create_agent(
         model=llm,
         tools=tools,
         system_prompt=DEFAULT_LLM_OPTIONS.system_prompt,
+        middleware=middleware,
         checkpointer=InMemorySaver(),
     )
 
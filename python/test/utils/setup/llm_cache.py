@@ -0,0 +1,73 @@
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Optional, Sequence, Union
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.load import dumps, loads
+from langchain_core.outputs import Generation
+
+# Cached entries are written by this suite only; deserialization is limited to
+# LangChain's own classes (generations and messages)
+_VALID_NAMESPACES = ["langchain_core"]
+
+# xdist workers share the database file; wait for a concurrent writer to finish
+# instead of failing with "database is locked"
+_BUSY_TIMEOUT_SECONDS = 30.0
+
+
+class SQLiteLLMCache(BaseCache):
+    """
+    LangChain LLM cache persisted in a local SQLite database.
+
+    Entries are keyed on the prompt and the LLM string (model name, parameters and
+    bound tool schemas), so changing prompts or tools naturally misses the cache.
+    Delete the database file to start from scratch.
+    """
+
+    def __init__(self, database_path: Union[str, Path]):
+        self._lock = threading.Lock()
+        # LangChain runs async cache lookups in worker threads
+        self._conn = sqlite3.connect(
+            str(database_path),
+            timeout=_BUSY_TIMEOUT_SECONDS,
+            check_same_thread=False,
+        )
+        with self._lock, self._conn:
+            # WAL lets readers in other processes proceed while one worker writes
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "prompt TEXT NOT NULL, llm TEXT NOT NULL, idx INTEGER NOT NULL, "
+                "response TEXT NOT NULL, PRIMARY KEY (prompt, llm, idx))"
+            )
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT response FROM llm_cache WHERE prompt = ? AND llm = ? ORDER BY idx",
+                (prompt, llm_string),
+            ).fetchall()
+        if not rows:
+            return None
+        return [loads(row[0], valid_namespaces=_VALID_NAMESPACES) for row in rows]
+
+    def update(
+        self, prompt: str, llm_string: str, return_val: Sequence[Generation]
+    ) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM llm_cache WHERE prompt = ? AND llm = ?",
+                (prompt, llm_string),
+            )
+            self._conn.executemany(
+                "INSERT INTO llm_cache (prompt, llm, idx, response) VALUES (?, ?, ?, ?)",
+                [
+                    (prompt, llm_string, idx, dumps(generation))
+                    for idx, generation in enumerate(return_val)
+                ],
+            )
+
+    def clear(self, **kwargs: Any) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM llm_cache")
@@ -1,5 +1,6 @@
 from enum import Enum
 from typing import Optional, Union
+from urllib.parse import urlparse
 
 from langchain_anthropic import ChatAnthropic
 from langchain_core.language_models.chat_models import BaseChatModel
@@ -30,6 +31,10 @@ class LLMOptions(BaseModel):
     )
     api_key: Optional[str] = Field(None, description="API key for the provider")
     base_url: Optional[str] = Field(None, description="Custom base URL (OpenAI only)")
+    prompt_cache_key: Optional[str] = Field(
+        None,
+        description="Routes requests sharing a prompt prefix to the same cache (OpenAI only)",
+    )
     max_iterations: Optional[int] = Field(1, description="Maximum reasoning iterations")
     system_prompt: Optional[str] = Field(
         "", description="System prompt for initialization"
@@ -65,6 +70,12 @@ class LLMFactory:
                     temperature=options.temperature,
                     api_key=options.api_key,
                     base_url=options.base_url,
+                    extra_body=(
+                        {"prompt_cache_key": options.prompt_cache_key}
+                        if options.prompt_cache_key
+                        and LLMFactory.is_openai_endpoint(options.base_url)
+                        else None
+                    ),
                 )
             case LLMProvider.ANTHROPIC:
                 api_key = SecretStr(options.api_key)
@@ -84,6 +95,15 @@ class LLMFactory:
             case _:
                 raise ValueError(f"Unsupported LLM provider: {options.provider}")
 
+    @staticmethod
+    def is_openai_endpoint(base_url: Optional[str]) -> bool:
+        """Returns whether requests go to the OpenAI API rather than a compatible server.
+
+        OpenAI-compatible servers may reject parameters they do not know, such as
+        ``prompt_cache_key``.
+        """
+        return base_url is None or urlparse(base_url).hostname == "api.openai.com"
+
     @staticmethod
     def get_default_model(provider: LLMProvider) -> str:
         """Returns the default model for a given provider."""